@@ -1,49 +1,336 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
+import random
 import time
+import traceback
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 
-from ..generator import generate_chapter, generate_chapter_summary
+from ..generator import (
+    generate_chapter,
+    generate_chapter_summary,
+    generate_chapter_with_markdown,
+)
 from ..image import generate_scene_image
-from ..settings import load_user_settings
+from ..models import Chapter, WorldConfig, WorldState
 from ..storage import WORLDS_DIR, validate_slug
-from ..world import load_world, save_world
+from ..world import find_chapter, load_world, save_world
+from .dependencies import (
+    executor,
+    get_cached_settings,
+    image_executor,
+    is_known_world,
+    load_world_cached,
+    text_executor,
+    world_dir_exists,
+)
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/worlds/{slug}/chapters", tags=["chapters"])
+router = APIRouter(
+    prefix="/api/worlds/{slug}/chapters",
+    tags=["chapters"],
+    default_response_class=ORJSONResponse,
+)
 
-# Thread pool for running sync operations
-executor = ThreadPoolExecutor(max_workers=4)
+# Active generation jobs, each channel carrying (sse_frame, is_final) tuples.
+# Channels hold a single frame with latest-progress semantics: a newer update
+# replaces one the client hasn't read yet, so slow clients never see stale
+# progress and nothing piles up in memory.
+active_jobs: Dict[str, JobChannel] = {}
 
-# Active generation jobs
-active_jobs: Dict[str, asyncio.Queue] = {}
+# Seconds a job stays registered; reaps jobs whose client never connected
+_JOB_TTL = 600
 
-# Settings cache with TTL
-_settings_cache = None
-_settings_cache_time = 0
-_SETTINGS_CACHE_TTL = 60
+# Upper bound on registered jobs; the oldest registration is evicted first
+_MAX_JOBS = 1024
 
+# Seconds between progress updates while a text/image call is running
+_PROGRESS_INTERVAL = 0.5
 
-def get_cached_settings():
-    """Get cached settings or load fresh if cache expired."""
-    global _settings_cache, _settings_cache_time
-    current_time = time.time()
-    if (
-        _settings_cache is None
-        or current_time - _settings_cache_time > _SETTINGS_CACHE_TTL
-    ):
-        _settings_cache = load_user_settings()
-        _settings_cache_time = current_time
-    return _settings_cache
+# Expected seconds per stage, used to pace progress. Seeded with typical
+# provider latencies and updated as an EWMA of observed durations so the
+# bar tracks slower or faster models instead of stalling near the end.
+_stage_estimates: Dict[str, float] = {"text": 40.0, "image": 8.0}
+_ESTIMATE_ALPHA = 0.3
+
+# Stages finishing faster than this were served from cache rather than
+# generated, so they say nothing about provider latency and are not sampled
+_MIN_ESTIMATE_SAMPLE = 1.0
+
+# Seconds between keep-alive comments on idle SSE streams, so proxies don't
+# drop the connection during long text/image generation calls
+SSE_PING_INTERVAL = 15
+
+
+async def _resolve_world(slug: str) -> str:
+    """Validate a slug and check the world exists, returning the clean slug.
+
+    Raises:
+        HTTPException: 400 if slug is invalid, 404 if world not found
+    """
+    try:
+        slug = validate_slug(slug)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    world_path = WORLDS_DIR / slug
+    if is_known_world(world_path):
+        return slug
+
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(executor, world_dir_exists, world_path):
+        raise HTTPException(status_code=404, detail="World not found")
+    return slug
+
+
+def _load_world_cached(slug: str) -> tuple[WorldConfig, WorldState, dict]:
+    """Load a world for read-only use; see dependencies.load_world_cached."""
+    return load_world_cached(WORLDS_DIR / slug, load_world)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with a trailing Z, e.g. 2025-01-01T12:00:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+_CHOICE_FIELDS = ("id", "text", "description")
+
+
+def _choice_to_dict(choice) -> dict:
+    """Shallow dict of a Choice, avoiding asdict()'s recursive deepcopy."""
+    return {f: getattr(choice, f) for f in _CHOICE_FIELDS}
+
+
+# Pre-encoded SSE frame pieces; a frame is prefix + orjson payload + suffix
+_PROGRESS_PREFIX = b"event: progress\ndata: "
+_COMPLETE_PREFIX = b"event: complete\ndata: "
+_ERROR_PREFIX = b"event: error\ndata: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse_frame(prefix: bytes, payload: dict) -> bytes:
+    """Encode a single server-sent event frame."""
+    return prefix + orjson.dumps(payload) + _SSE_SUFFIX
+
+
+class JobChannel:
+    """Single-slot mailbox between one job producer and one SSE consumer.
+
+    Each job has exactly one writer and at most one reader, so a slot plus a
+    future the reader awaits replaces asyncio.Queue's locking and getter
+    bookkeeping. A newer item replaces one the reader hasn't taken yet.
+    Once the reader goes away the channel is closed and further items are
+    dropped.
+    """
+
+    __slots__ = ("_item", "_waiter", "closed")
+
+    def __init__(self) -> None:
+        self._item: Optional[tuple[bytes, bool]] = None
+        self._waiter: Optional[asyncio.Future] = None
+        self.closed = False
+
+    def close(self) -> None:
+        """Mark the reader as gone and discard any unread item."""
+        self.closed = True
+        self._item = None
+
+    def offer(self, item: tuple[bytes, bool]) -> None:
+        """Store item, replacing any unread one, and wake a waiting reader.
+
+        Only progress frames can be replaced: the terminal frame is always
+        the last one a job produces.
+        """
+        if self.closed:
+            return
+        self._item = item
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def empty(self) -> bool:
+        return self._item is None
+
+    def get_nowait(self) -> tuple[bytes, bool]:
+        item = self._item
+        if item is None:
+            raise asyncio.QueueEmpty
+        self._item = None
+        return item
+
+    async def get(self) -> tuple[bytes, bool]:
+        while self.empty():
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self.get_nowait()
+
+
+def _register_job() -> tuple[str, JobChannel]:
+    """Create and register a job channel, scheduling its removal after _JOB_TTL.
+
+    The stream endpoint removes the entry when its client finishes; the
+    timer covers jobs nobody ever streams. Past _MAX_JOBS the oldest entry
+    is evicted; a stream already attached to it keeps its own reference.
+    """
+    while len(active_jobs) >= _MAX_JOBS:
+        active_jobs.pop(next(iter(active_jobs)))
+
+    job_id = uuid.uuid4().hex
+    channel = JobChannel()
+    active_jobs[job_id] = channel
+    asyncio.get_running_loop().call_later(_JOB_TTL, active_jobs.pop, job_id, None)
+    return job_id, channel
+
+
+def _put_event(channel: JobChannel, update: dict) -> None:
+    """Serialize a job update into its SSE frame once and offer it to the channel.
+
+    Terminal updates ("complete" and "error") are flagged so the stream
+    knows to close after sending them. Nothing is encoded once the stream's
+    client has gone.
+    """
+    if channel.closed:
+        return
+    stage = update["stage"]
+    if stage == "complete":
+        channel.offer((_sse_frame(_COMPLETE_PREFIX, update["chapter"]), True))
+    elif stage == "error":
+        channel.offer((_sse_frame(_ERROR_PREFIX, {"error": update["error"]}), True))
+    else:
+        channel.offer((_sse_frame(_PROGRESS_PREFIX, update), False))
+
+
+async def _progress_ticker(
+    channel: JobChannel,
+    stage: str,
+    label: str,
+    start_percent: int,
+    end_percent: int,
+    estimated_duration: float,
+    started_at: float,
+) -> None:
+    """Emit eased progress updates for a running stage until cancelled.
+
+    started_at is a time.monotonic() reading. A tick whose percent and whole
+    elapsed seconds match the last frame is skipped, since it would render
+    identically.
+    """
+    # _put_event encodes the update immediately, so one dict can be reused
+    update = {"stage": stage, "percent": start_percent, "message": label}
+    template = label + " (%ds)"
+    span = end_percent - start_percent
+    clock = time.monotonic
+    last = None
+    while True:
+        elapsed = clock() - started_at
+        progress_ratio = min(elapsed / estimated_duration, 1.0)
+        # Use easing function for smoother progress (slower at end)
+        eased_progress = 1 - (1 - progress_ratio) ** 2
+
+        shown = (int(start_percent + span * eased_progress), int(elapsed))
+        if shown != last:
+            last = shown
+            update["percent"], seconds = shown
+            update["message"] = template % seconds
+            _put_event(channel, update)
+        await asyncio.sleep(_PROGRESS_INTERVAL)
+
+
+async def _await_with_progress(
+    future: asyncio.Future,
+    channel: JobChannel,
+    stage: str,
+    label: str,
+    start_percent: int,
+    end_percent: int,
+    started_at: float,
+):
+    """Await an executor future while a progress ticker reports on it.
+
+    The stage's duration estimate is updated from the observed time once the
+    future succeeds, unless it finished too quickly to be a real generation.
+    """
+    ticker = asyncio.create_task(
+        _progress_ticker(
+            channel,
+            stage,
+            label,
+            start_percent,
+            end_percent,
+            _stage_estimates[stage],
+            started_at,
+        )
+    )
+    try:
+        result = await future
+    finally:
+        ticker.cancel()
+        await asyncio.gather(ticker, return_exceptions=True)
+
+    duration = time.monotonic() - started_at
+    if duration >= _MIN_ESTIMATE_SAMPLE:
+        estimate = _stage_estimates[stage]
+        _stage_estimates[stage] = max(
+            1.0, estimate + _ESTIMATE_ALPHA * (duration - estimate)
+        )
+    return result
+
+
+def _read_chapter_file(chapter_path: Path) -> Optional[str]:
+    """Read chapter markdown, or return None if the file is missing."""
+    try:
+        return chapter_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _scene_entries(scenes_dir: Path, chapter_num: int) -> list[os.DirEntry]:
+    """List a chapter's scene images (scene-0001-{hash}.png) in one directory scan."""
+    prefix = f"scene-{chapter_num:04d}-"
+    try:
+        with os.scandir(scenes_dir) as it:
+            return [
+                entry
+                for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith(".png")
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _find_latest_scene(scenes_dir: Path, chapter_num: int) -> Optional[Path]:
+    """Find the most recently written scene image for a chapter."""
+    latest = max(
+        _scene_entries(scenes_dir, chapter_num),
+        key=lambda entry: entry.stat().st_mtime,
+        default=None,
+    )
+    return Path(latest.path) if latest else None
+
+
+def _delete_chapter_files(
+    base_dir: Path, chapter_filename: Optional[str], chapter_num: int
+) -> None:
+    """Remove a chapter's markdown file and its scene images from disk."""
+    if chapter_filename:
+        (base_dir / "chapters" / chapter_filename).unlink(missing_ok=True)
+
+    for entry in _scene_entries(base_dir / "media" / "scenes", chapter_num):
+        os.unlink(entry.path)
+        logger.debug("Deleted scene image: %s", entry.name)
 
 
 class ChapterGenerateRequest(BaseModel):
@@ -62,19 +349,11 @@ class ChoiceSelectionRequest(BaseModel):
 @router.post("")
 async def start_chapter_generation(slug: str, request: ChapterGenerateRequest):
     """Start chapter generation and return job ID for SSE streaming"""
-    try:
-        slug = validate_slug(slug)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    if not (WORLDS_DIR / slug).exists():
-        raise HTTPException(status_code=404, detail="World not found")
+    slug = await _resolve_world(slug)
 
-    job_id = str(uuid.uuid4())
-    queue: asyncio.Queue[str] = asyncio.Queue()
-    active_jobs[job_id] = queue
+    job_id, channel = _register_job()
 
-    asyncio.create_task(run_chapter_generation(slug, request, queue, job_id))
+    asyncio.create_task(run_chapter_generation(slug, request, channel, job_id))
 
     return {"job_id": job_id}
 
@@ -87,65 +366,144 @@ async def stream_chapter_progress(slug: str, job_id: str):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    queue = active_jobs.get(job_id)
-    if not queue:
+    channel = active_jobs.get(job_id)
+    if channel is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
     async def event_stream():
         try:
             while True:
-                update = await queue.get()
-
-                if update["stage"] == "complete":
-                    yield f"event: complete\ndata: {json.dumps(update['chapter'])}\n\n"
-                    break
-                elif update["stage"] == "error":
-                    yield f"event: error\ndata: {json.dumps({'error': update['error']})}\n\n"
+                # Frames arrive pre-encoded from the producer
+                frame, is_final = await channel.get()
+                yield frame
+                if is_final:
                     break
-                else:
-                    yield f"event: progress\ndata: {json.dumps(update)}\n\n"
         finally:
-            if job_id in active_jobs:
-                del active_jobs[job_id]
+            # The job keeps running after a disconnect; stop it encoding frames
+            channel.close()
+            active_jobs.pop(job_id, None)
+
+    # Frames are already encoded bytes, which EventSourceResponse passes through as-is
+    return EventSourceResponse(event_stream(), ping=SSE_PING_INTERVAL)
+
+
+async def _scene_image_stage(
+    channel: JobChannel,
+    cfg: WorldConfig,
+    dirs: dict,
+    chapter: Chapter,
+    no_images: bool,
+    bypass_cache: bool = False,
+) -> tuple[Optional[Path], Optional[str]]:
+    """Generate a chapter's scene image with progress, returning (path, model).
+
+    Returns (None, None) when images are disabled or the chapter has no
+    prompt to draw from.
+    """
+    if no_images or not (chapter.image_prompt or chapter.scene_prompt):
+        return None, None
+
+    settings = await get_cached_settings()
+    image_model = settings.default_image_model
+
+    _put_event(
+        channel,
+        {
+            "stage": "image",
+            "percent": 90,
+            "message": f"Generating image ({image_model})...",
+        },
+    )
+
+    # Prefer concise image_prompt, fallback to scene_prompt for backward compatibility
+    prompt_for_image = (
+        chapter.image_prompt if chapter.image_prompt else chapter.scene_prompt
+    )
+    image_start = time.monotonic()
+    image_future = asyncio.get_running_loop().run_in_executor(
+        image_executor,
+        generate_scene_image,
+        dirs["base"],
+        image_model,
+        cfg.style_pack,
+        prompt_for_image,
+        chapter.number,
+        "16:9",  # aspect_ratio
+        bypass_cache,
+    )
+
+    path = await _await_with_progress(
+        image_future, channel, "image", "Scene image...", 90, 93, image_start
+    )
+
+    duration = time.monotonic() - image_start
+    logger.info("Image generation completed: %.2fs", duration)
+
+    _put_event(
+        channel,
+        {
+            "stage": "image",
+            "percent": 94,
+            "message": f"Image generation complete ({duration:.1f}s)",
+        },
+    )
+    return path, image_model
+
 
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+def _chapter_payload(chapter: Chapter, scene: Optional[str]) -> dict:
+    """Build the chapter dict sent with a job's complete event."""
+    return {
+        "number": chapter.number,
+        "title": chapter.title,
+        "filename": chapter.filename,
+        "summary": chapter.summary,
+        "scene_prompt": chapter.scene_prompt,
+        "image_prompt": chapter.image_prompt,
+        "characters_in_scene": chapter.characters_in_scene,
+        "choices": [_choice_to_dict(c) for c in chapter.choices or ()],
+        "selected_choice_id": chapter.selected_choice_id,
+        "choice_reasoning": chapter.choice_reasoning,
+        "scene": scene,
+        "generated_at": chapter.generated_at,
+        "text_model_used": chapter.text_model_used,
+        "image_model_used": chapter.image_model_used,
+    }
 
 
 async def run_chapter_generation(
-    slug: str, request: ChapterGenerateRequest, queue: asyncio.Queue, job_id: str
+    slug: str, request: ChapterGenerateRequest, channel: JobChannel, job_id: str
 ):
     """Background task to generate chapter with progress updates"""
-    import time
-    import traceback
-
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        await queue.put({"stage": "init", "percent": 5, "message": "Loading world..."})
+        _put_event(
+            channel, {"stage": "init", "percent": 5, "message": "Loading world..."}
+        )
 
         cfg, state, dirs = await loop.run_in_executor(executor, load_world, slug)
 
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "init",
                 "percent": 8,
                 "message": "World loaded, preparing generation...",
-            }
+            },
         )
 
         if cfg.enable_choices and state.chapters:
             prev_chapter = state.chapters[-1]
             if prev_chapter.choices and not prev_chapter.selected_choice_id:
-                import random
-
                 selected_choice = random.choice(prev_chapter.choices)
 
-                await queue.put(
+                _put_event(
+                    channel,
                     {
                         "stage": "init",
                         "percent": 9,
                         "message": f"Auto-selecting choice: '{selected_choice.text[:50]}...'",
-                    }
+                    },
                 )
 
                 prev_chapter.selected_choice_id = selected_choice.id
@@ -153,14 +511,15 @@ async def run_chapter_generation(
 
                 await loop.run_in_executor(executor, save_world, slug, cfg, state, dirs)
 
-        await queue.put(
-            {"stage": "text", "percent": 10, "message": "Generating chapter text..."}
+        _put_event(
+            channel,
+            {"stage": "text", "percent": 10, "message": "Generating chapter text..."},
         )
 
-        text_start = time.time()
+        text_start = time.monotonic()
         text_future = loop.run_in_executor(
-            executor,
-            generate_chapter,
+            text_executor,
+            generate_chapter_with_markdown,
             dirs["base"],
             cfg,
             state,
@@ -168,264 +527,142 @@ async def run_chapter_generation(
             request.chapter_length,
         )
 
-        estimated_duration = 40.0
-        start_percent = 10
-        end_percent = 85
-        update_interval = 0.5
-
-        while not text_future.done():
-            elapsed = time.time() - text_start
-            progress_ratio = min(elapsed / estimated_duration, 1.0)
-            # Use easing function for smoother progress (slower at end)
-            eased_progress = 1 - (1 - progress_ratio) ** 2
-            current_percent = int(
-                start_percent + (end_percent - start_percent) * eased_progress
-            )
-
-            await queue.put(
-                {
-                    "stage": "text",
-                    "percent": current_percent,
-                    "message": f"Chapter text... ({elapsed:.0f}s)",
-                }
-            )
-
-            try:
-                await asyncio.wait_for(
-                    asyncio.shield(text_future), timeout=update_interval
-                )
-                break
-            except asyncio.TimeoutError:
-                continue
+        chapter, chapter_md = await _await_with_progress(
+            text_future, channel, "text", "Chapter text...", 10, 85, text_start
+        )
 
-        chapter = await text_future
-        text_duration = time.time() - text_start
+        text_duration = time.monotonic() - text_start
         logger.info("Text generation completed: %.2fs", text_duration)
 
-        # Read chapter markdown for summary generation
-        chapter_md = (dirs["base"] / "chapters" / chapter.filename).read_text(
-            encoding="utf-8"
-        )
-
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "post-processing",
                 "percent": 70,
                 "message": "Generating summary and image...",
-            }
+            },
         )
 
-        # Start summary generation (runs in parallel with image)
-        summary_task = asyncio.create_task(generate_chapter_summary(chapter_md, cfg))
-
-        # Generate image if needed
-        image_path = None
-        actual_image_model = None
-        if not request.no_images and (chapter.image_prompt or chapter.scene_prompt):
-            settings = get_cached_settings()
-            actual_image_model = settings.default_image_model
-
-            await queue.put(
-                {
-                    "stage": "image",
-                    "percent": 90,
-                    "message": f"Generating image ({actual_image_model})...",
-                }
+        # Summary and image run concurrently; the slower of the two sets the
+        # latency, and a failure in either cancels the other
+        async with asyncio.TaskGroup() as tg:
+            summary_task = tg.create_task(
+                generate_chapter_summary(chapter_md, cfg, text_executor)
             )
-
-            # Start image generation in background
-            # Prefer concise image_prompt, fallback to scene_prompt for backward compatibility
-            prompt_for_image = chapter.image_prompt if chapter.image_prompt else chapter.scene_prompt
-            image_start = time.time()
-            image_future = loop.run_in_executor(
-                executor,
-                generate_scene_image,
-                dirs["base"],
-                actual_image_model,
-                cfg.style_pack,
-                prompt_for_image,
-                chapter.number,
+            image_task = tg.create_task(
+                _scene_image_stage(channel, cfg, dirs, chapter, request.no_images)
             )
-
-            estimated_image_duration = 8.0
-            start_percent = 90
-            end_percent = 93
-            update_interval = 0.5
-
-            while not image_future.done():
-                elapsed = time.time() - image_start
-                progress_ratio = min(elapsed / estimated_image_duration, 1.0)
-                eased_progress = 1 - (1 - progress_ratio) ** 2
-                current_percent = int(
-                    start_percent + (end_percent - start_percent) * eased_progress
-                )
-
-                await queue.put(
-                    {
-                        "stage": "image",
-                        "percent": current_percent,
-                        "message": f"Scene image... ({elapsed:.0f}s)",
-                    }
-                )
-
-                try:
-                    await asyncio.wait_for(
-                        asyncio.shield(image_future), timeout=update_interval
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    continue
-
-            image_path = await image_future
-            image_duration = time.time() - image_start
-            logger.info("Image generation completed: %.2fs", image_duration)
-
-            await queue.put(
-                {
-                    "stage": "image",
-                    "percent": 94,
-                    "message": f"Image generation complete ({image_duration:.1f}s)",
-                }
-            )
-
-        # Wait for summary generation to complete
-        await queue.put(
-            {
-                "stage": "post-processing",
-                "percent": 95,
-                "message": "Finalizing summary...",
-            }
-        )
-
-        ai_summary = await summary_task
+        ai_summary = summary_task.result()
+        image_path, actual_image_model = image_task.result()
         chapter.ai_summary = ai_summary
         if ai_summary:
             logger.debug("Generated AI summary: %s...", ai_summary[:50])
 
         # Add metadata to chapter
-        from datetime import datetime
-
-        chapter.generated_at = datetime.utcnow().isoformat() + "Z"
+        chapter.generated_at = _utc_timestamp()
         # text_model_used is already set in generator.py, don't override it
         # Set image model only if it was actually generated
         if actual_image_model:
             chapter.image_model_used = actual_image_model
 
-        await queue.put(
-            {"stage": "saving", "percent": 95, "message": "Saving world state..."}
+        _put_event(
+            channel,
+            {"stage": "saving", "percent": 95, "message": "Saving world state..."},
         )
 
-        state.chapters.append(chapter.__dict__)
+        state.chapters.append(chapter)
         state.next_chapter += 1
 
         await loop.run_in_executor(executor, save_world, slug, cfg, state, dirs)
 
-        from dataclasses import asdict
-
-        chapter_data = {
-            "number": chapter.number,
-            "title": chapter.title,
-            "filename": chapter.filename,
-            "summary": chapter.summary,
-            "scene_prompt": chapter.scene_prompt,
-            "image_prompt": chapter.image_prompt,
-            "characters_in_scene": chapter.characters_in_scene,
-            "choices": [asdict(c) for c in chapter.choices] if chapter.choices else [],
-            "selected_choice_id": chapter.selected_choice_id,
-            "choice_reasoning": chapter.choice_reasoning,
-            "scene": (
-                f"/worlds/{slug}/media/scenes/{image_path.name}" if image_path else None
-            ),
-            "generated_at": chapter.generated_at,
-            "text_model_used": chapter.text_model_used,
-            "image_model_used": chapter.image_model_used,
-        }
+        chapter_data = _chapter_payload(
+            chapter,
+            f"/worlds/{slug}/media/scenes/{image_path.name}" if image_path else None,
+        )
 
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "complete",
                 "percent": 100,
                 "message": "Chapter complete!",
                 "chapter": chapter_data,
-            }
+            },
         )
 
     except Exception as e:
-        import logging
-
         logging.exception(f"Chapter generation failed for job {job_id}")
 
+        # A failed summary/image stage surfaces wrapped by the TaskGroup
+        while isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
         error_msg = f"{type(e).__name__}: {str(e)}"
         traceback_str = traceback.format_exc()
         logging.error(f"Full traceback: {traceback_str}")
 
         # Send sanitized error to client (no traceback or error details)
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "error",
                 "error": "Chapter generation failed. Please check your settings and try again.",
                 "job_id": job_id,  # For support reference
-            }
+            },
         )
         logger.error("Chapter generation failed: %s", error_msg)
 
 
+async def _chapter_path(slug: str, chapter_num: int) -> Path:
+    """Validate the world and chapter and return the chapter's markdown path"""
+    slug = await _resolve_world(slug)
+
+    loop = asyncio.get_running_loop()
+    cfg, state, dirs = await loop.run_in_executor(executor, _load_world_cached, slug)
+
+    found = find_chapter(state, chapter_num)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+
+    return dirs["base"] / "chapters" / found[1].filename
+
+
 @router.get("/{chapter_num}/content")
 async def get_chapter_content(slug: str, chapter_num: int):
     """Get the markdown content of a specific chapter"""
-    try:
-        slug = validate_slug(slug)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    chapter_path = await _chapter_path(slug, chapter_num)
 
-    if not (WORLDS_DIR / slug).exists():
-        raise HTTPException(status_code=404, detail="World not found")
+    loop = asyncio.get_running_loop()
+    content = await loop.run_in_executor(executor, _read_chapter_file, chapter_path)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Chapter file not found")
 
-    cfg, state, dirs = load_world(slug)
+    return {"content": content}
 
-    # Find chapter
-    chapter_file = None
-    for ch in state.chapters:
-        if ch.number == chapter_num:
-            chapter_file = ch.filename
-            break
 
-    if not chapter_file:
-        raise HTTPException(status_code=404, detail="Chapter not found")
+@router.get("/{chapter_num}/raw")
+async def get_chapter_raw(slug: str, chapter_num: int):
+    """Serve a chapter's markdown file directly, without a JSON envelope"""
+    chapter_path = await _chapter_path(slug, chapter_num)
 
-    chapter_path = dirs["base"] / "chapters" / chapter_file
-    if not chapter_path.exists():
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(executor, chapter_path.is_file):
         raise HTTPException(status_code=404, detail="Chapter file not found")
 
-    content = chapter_path.read_text(encoding="utf-8")
-    return {"content": content}
+    return FileResponse(chapter_path, media_type="text/markdown; charset=utf-8")
 
 
 @router.post("/{chapter_num}/select-choice")
 async def select_choice(slug: str, chapter_num: int, request: ChoiceSelectionRequest):
     """Record user's choice selection"""
-    try:
-        slug = validate_slug(slug)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    if not (WORLDS_DIR / slug).exists():
-        raise HTTPException(status_code=404, detail="World not found")
+    slug = await _resolve_world(slug)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     cfg, state, dirs = await loop.run_in_executor(executor, load_world, slug)
 
-    # Find the chapter
-    chapter_index = None
-    chapter_data = None
-    for i, ch in enumerate(state.chapters):
-        if ch.number == chapter_num:
-            chapter_index = i
-            chapter_data = ch
-            break
-
-    if chapter_index is None:
+    found = find_chapter(state, chapter_num)
+    if found is None:
         raise HTTPException(status_code=404, detail="Chapter not found")
+    chapter_index, chapter_data = found
 
     # Verify chapter has choices
     choices = chapter_data.choices
@@ -435,8 +672,6 @@ async def select_choice(slug: str, chapter_num: int, request: ChoiceSelectionReq
     # Handle auto-selection
     choice_id = request.choice_id
     if choice_id == "auto":
-        import random
-
         choice_id = random.choice(choices).id
 
     # Find the selected choice
@@ -457,14 +692,7 @@ async def select_choice(slug: str, chapter_num: int, request: ChoiceSelectionReq
     # Save world state
     await loop.run_in_executor(executor, save_world, slug, cfg, state, dirs)
 
-    return {
-        "success": True,
-        "choice": {
-            "id": selected_choice.id,
-            "text": selected_choice.text,
-            "description": selected_choice.description,
-        },
-    }
+    return {"success": True, "choice": _choice_to_dict(selected_choice)}
 
 
 @router.put("/{chapter_num}/reroll")
@@ -472,25 +700,17 @@ async def reroll_chapter(
     slug: str, chapter_num: int, request: Optional[ChapterGenerateRequest] = None
 ):
     """Regenerate text for a specific chapter"""
-    try:
-        slug = validate_slug(slug)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    if not (WORLDS_DIR / slug).exists():
-        raise HTTPException(status_code=404, detail="World not found")
+    slug = await _resolve_world(slug)
 
     # Start regeneration job
-    job_id = str(uuid.uuid4())
-    queue: asyncio.Queue[str] = asyncio.Queue()
-    active_jobs[job_id] = queue
+    job_id, channel = _register_job()
 
     # Use default options if not provided
     if request is None:
         request = ChapterGenerateRequest()
 
     # Start background task
-    asyncio.create_task(run_chapter_reroll(slug, chapter_num, request, queue, job_id))
+    asyncio.create_task(run_chapter_reroll(slug, chapter_num, request, channel, job_id))
 
     return {"job_id": job_id}
 
@@ -499,47 +719,40 @@ async def run_chapter_reroll(
     slug: str,
     chapter_num: int,
     request: ChapterGenerateRequest,
-    queue: asyncio.Queue,
+    channel: JobChannel,
     job_id: str,
 ):
     """Background task to regenerate a chapter"""
-    import time
-    import traceback
-
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        await queue.put({"stage": "init", "percent": 5, "message": "Loading world..."})
+        _put_event(
+            channel, {"stage": "init", "percent": 5, "message": "Loading world..."}
+        )
 
         cfg, state, dirs = await loop.run_in_executor(executor, load_world, slug)
 
-        # Find the chapter in state
-        chapter_index = None
-        old_chapter_data = None
-        for i, ch in enumerate(state.chapters):
-            if ch.number == chapter_num:
-                chapter_index = i
-                old_chapter_data = ch
-                break
-
-        if chapter_index is None:
-            await queue.put(
-                {"stage": "error", "error": f"Chapter {chapter_num} not found"}
+        found = find_chapter(state, chapter_num)
+        if found is None:
+            _put_event(
+                channel, {"stage": "error", "error": f"Chapter {chapter_num} not found"}
             )
             return
+        chapter_index, old_chapter_data = found
 
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "text",
                 "percent": 10,
                 "message": "Calling OpenAI API for chapter text...",
-            }
+            },
         )
 
         # Generate new chapter text with smooth progress
-        text_start = time.time()
+        text_start = time.monotonic()
         text_future = loop.run_in_executor(
-            executor,
+            text_executor,
             generate_chapter,
             dirs["base"],
             cfg,
@@ -548,38 +761,11 @@ async def run_chapter_reroll(
             request.chapter_length,
         )
 
-        # Send progress updates while waiting
-        estimated_duration = 40.0
-        start_percent = 10
-        end_percent = 85
-        update_interval = 0.5
-
-        while not text_future.done():
-            elapsed = time.time() - text_start
-            progress_ratio = min(elapsed / estimated_duration, 1.0)
-            eased_progress = 1 - (1 - progress_ratio) ** 2
-            current_percent = int(
-                start_percent + (end_percent - start_percent) * eased_progress
-            )
-
-            await queue.put(
-                {
-                    "stage": "text",
-                    "percent": current_percent,
-                    "message": f"Chapter text... ({elapsed:.0f}s)",
-                }
-            )
-
-            try:
-                await asyncio.wait_for(
-                    asyncio.shield(text_future), timeout=update_interval
-                )
-                break
-            except asyncio.TimeoutError:
-                continue
+        chapter = await _await_with_progress(
+            text_future, channel, "text", "Chapter text...", 10, 85, text_start
+        )
 
-        chapter = await text_future
-        text_duration = time.time() - text_start
+        text_duration = time.monotonic() - text_start
         logger.info("Text generation (reroll) completed: %.2fs", text_duration)
 
         # Override chapter number to match the one we're replacing
@@ -587,179 +773,81 @@ async def run_chapter_reroll(
         chapter.filename = old_chapter_data.filename
 
         # Set metadata timestamp
-        from datetime import datetime
-
-        chapter.generated_at = datetime.utcnow().isoformat() + "Z"
+        chapter.generated_at = _utc_timestamp()
 
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "text",
                 "percent": 89,
                 "message": f"Text generation complete ({text_duration:.1f}s)",
-            }
+            },
         )
 
-        # Generate image if needed
-        image_path = None
-        regen_image_model = None
-        if not request.no_images and (chapter.image_prompt or chapter.scene_prompt):
-            settings = get_cached_settings()
-            regen_image_model = settings.default_image_model
-
-            await queue.put(
-                {
-                    "stage": "image",
-                    "percent": 90,
-                    "message": f"Generating image ({regen_image_model})...",
-                }
-            )
-
-            # Start image generation with smooth progress
-            # Prefer concise image_prompt, fallback to scene_prompt for backward compatibility
-            prompt_for_image = chapter.image_prompt if chapter.image_prompt else chapter.scene_prompt
-            image_start = time.time()
-            image_future = loop.run_in_executor(
-                executor,
-                generate_scene_image,
-                dirs["base"],
-                regen_image_model,
-                cfg.style_pack,
-                prompt_for_image,
-                chapter.number,
-                "16:9",  # aspect_ratio
-                True,  # bypass_cache - always bypass when regenerating
-            )
-
-            # Send progress updates while waiting
-            estimated_image_duration = 8.0
-            start_percent = 90
-            end_percent = 93
-            update_interval = 0.5
-
-            while not image_future.done():
-                elapsed = time.time() - image_start
-                progress_ratio = min(elapsed / estimated_image_duration, 1.0)
-                eased_progress = 1 - (1 - progress_ratio) ** 2
-                current_percent = int(
-                    start_percent + (end_percent - start_percent) * eased_progress
-                )
-
-                await queue.put(
-                    {
-                        "stage": "image",
-                        "percent": current_percent,
-                        "message": f"Scene image... ({elapsed:.0f}s)",
-                    }
-                )
-
-                try:
-                    await asyncio.wait_for(
-                        asyncio.shield(image_future), timeout=update_interval
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    continue
-
-            image_path = await image_future
-            image_duration = time.time() - image_start
-            logger.info("Image generation (reroll) completed: %.2fs", image_duration)
-
-            await queue.put(
-                {
-                    "stage": "image",
-                    "percent": 94,
-                    "message": f"Image generation complete ({image_duration:.1f}s)",
-                }
-            )
-
-        await queue.put(
-            {"stage": "saving", "percent": 95, "message": "Saving world state..."}
+        image_path, regen_image_model = await _scene_image_stage(
+            channel, cfg, dirs, chapter, request.no_images, bypass_cache=True
         )
 
-        # Preserve important metadata from old chapter
-        from dataclasses import asdict
-
-        old_chapter_dict = (
-            asdict(old_chapter_data)
-            if hasattr(old_chapter_data, "__dict__")
-            else old_chapter_data
+        _put_event(
+            channel,
+            {"stage": "saving", "percent": 95, "message": "Saving world state..."},
         )
 
         # Update image metadata if regenerated
         if regen_image_model:
             chapter.image_model_used = regen_image_model
 
-        # Update the chapter in state
-        state.chapters[chapter_index] = asdict(chapter)
+        # Update the chapter in state; save_world serializes the dataclass
+        state.chapters[chapter_index] = chapter
+
+        # If no new image was generated, look up the existing one while saving
+        latest_scene_future = None
+        if not image_path:
+            latest_scene_future = loop.run_in_executor(
+                executor,
+                _find_latest_scene,
+                dirs["base"] / "media" / "scenes",
+                chapter_num,
+            )
 
         # Save world state
         await loop.run_in_executor(executor, save_world, slug, cfg, state, dirs)
 
-        # Find existing scene image if no new one was generated
         existing_scene_path = None
-        if not image_path:
-            scenes_dir = dirs["base"] / "media" / "scenes"
-            if scenes_dir.exists():
-                # Find most recent scene file for this chapter
-                pattern = f"scene-{chapter_num:04d}-*.png"
-                scene_files = sorted(
-                    scenes_dir.glob(pattern),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True,
-                )
-                if scene_files:
-                    existing_scene_path = (
-                        f"/worlds/{slug}/media/scenes/{scene_files[0].name}"
-                    )
-                    logger.info(f"🔗 Preserved existing image: {existing_scene_path}")
-                else:
-                    logger.info("⚠️ No existing scene image found")
-
-        # Build chapter data for response, preserving metadata
-        chapter_data = {
-            "number": chapter.number,
-            "title": chapter.title,
-            "filename": chapter.filename,
-            "summary": chapter.summary,
-            "scene_prompt": chapter.scene_prompt,
-            "image_prompt": chapter.image_prompt,
-            "characters_in_scene": chapter.characters_in_scene,
-            "choices": [asdict(c) for c in chapter.choices] if chapter.choices else [],
-            "selected_choice_id": old_chapter_dict.get(
-                "selected_choice_id", chapter.selected_choice_id
-            ),
-            "choice_reasoning": old_chapter_dict.get(
-                "choice_reasoning", chapter.choice_reasoning
-            ),
-            "scene": (
+        if latest_scene_future is not None:
+            latest_scene = await latest_scene_future
+            if latest_scene:
+                existing_scene_path = f"/worlds/{slug}/media/scenes/{latest_scene.name}"
+                logger.info(f"🔗 Preserved existing image: {existing_scene_path}")
+            else:
+                logger.info("⚠️ No existing scene image found")
+
+        # Build chapter data for response, preserving metadata from the old chapter
+        chapter_data = _chapter_payload(
+            chapter,
+            (
                 f"/worlds/{slug}/media/scenes/{image_path.name}"
                 if image_path
                 else existing_scene_path
             ),
-            "generated_at": chapter.generated_at,
-            "text_model_used": chapter.text_model_used,
-            "image_model_used": (
-                regen_image_model
-                if regen_image_model
-                else old_chapter_dict.get("image_model_used")
-            ),
-            "ai_summary": old_chapter_dict.get(
-                "ai_summary", None
-            ),  # Preserve AI summary
-        }
-
-        await queue.put(
+        )
+        chapter_data["selected_choice_id"] = old_chapter_data.selected_choice_id
+        chapter_data["choice_reasoning"] = old_chapter_data.choice_reasoning
+        if not regen_image_model:
+            chapter_data["image_model_used"] = old_chapter_data.image_model_used
+        chapter_data["ai_summary"] = old_chapter_data.ai_summary
+
+        _put_event(
+            channel,
             {
                 "stage": "complete",
                 "percent": 100,
                 "message": "Chapter regenerated!",
                 "chapter": chapter_data,
-            }
+            },
         )
 
     except Exception as e:
-        import logging
-
         logging.exception(f"Chapter reroll failed for job {job_id}")
 
         error_msg = f"{type(e).__name__}: {str(e)}"
@@ -767,13 +855,14 @@ async def run_chapter_reroll(
         logging.error(f"Full traceback: {traceback_str}")
 
         # Send sanitized error to client (no traceback)
-        await queue.put(
+        _put_event(
+            channel,
             {
                 "stage": "error",
                 "error": "Chapter regeneration failed. Please check your settings and try again.",
                 "error_type": type(e).__name__,
                 "job_id": job_id,  # For support reference
-            }
+            },
         )
         logger.error("Chapter reroll failed: %s", error_msg)
 
@@ -781,44 +870,24 @@ async def run_chapter_reroll(
 @router.delete("/{chapter_num}")
 async def delete_chapter(slug: str, chapter_num: int):
     """Delete a specific chapter"""
-    try:
-        slug = validate_slug(slug)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    if not (WORLDS_DIR / slug).exists():
-        raise HTTPException(status_code=404, detail="World not found")
+    slug = await _resolve_world(slug)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     cfg, state, dirs = await loop.run_in_executor(executor, load_world, slug)
 
-    # Find the chapter in state
-    chapter_index = None
-    chapter_data = None
-    for i, ch in enumerate(state.chapters):
-        if ch.number == chapter_num:
-            chapter_index = i
-            chapter_data = ch
-            break
-
-    if chapter_index is None:
+    found = find_chapter(state, chapter_num)
+    if found is None:
         raise HTTPException(status_code=404, detail="Chapter not found")
-
-    # Delete chapter file
-    chapter_filename = chapter_data.filename
-    if chapter_filename:
-        chapter_path = dirs["base"] / "chapters" / chapter_filename
-        if chapter_path.exists():
-            chapter_path.unlink()
-
-    # Delete scene image(s) if they exist
-    # Scene images are named like: scene-0001-{hash}.png
-    scenes_dir = dirs["base"] / "media" / "scenes"
-    if scenes_dir.exists():
-        pattern = f"scene-{chapter_num:04d}-*.png"
-        for scene_file in scenes_dir.glob(pattern):
-            scene_file.unlink()
-            logger.debug("Deleted scene image: %s", scene_file.name)
+    chapter_index, chapter_data = found
+
+    # Delete chapter file and scene image(s) in a single executor round trip
+    await loop.run_in_executor(
+        executor,
+        _delete_chapter_files,
+        dirs["base"],
+        chapter_data.filename,
+        chapter_num,
+    )
 
     # Remove chapter from state
     state.chapters.pop(chapter_index)
@@ -3,19 +3,159 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from fastapi import HTTPException
 from fastapi import Path as PathParam
 
 from ..models import WorldConfig, WorldState
+from ..settings import load_user_settings
 from ..storage import WORLDS_DIR, validate_slug
 from ..world import load_world
 
-# Thread executor for blocking operations
-executor = ThreadPoolExecutor(max_workers=4)
+# Thread pools shared by the API routers, one per workload so quick world
+# reads/writes never queue behind long-running text or image provider calls.
+# Generation is network-bound (threads spend nearly all their time waiting on
+# the provider), so threads rather than processes, and the worker count is
+# the cap on concurrent provider calls per pool.
+GEN_CONCURRENCY = int(os.environ.get("LSW_GEN_CONCURRENCY", "16"))
+executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="lsw-io")
+text_executor = ThreadPoolExecutor(
+    max_workers=GEN_CONCURRENCY, thread_name_prefix="lsw-text"
+)
+image_executor = ThreadPoolExecutor(
+    max_workers=GEN_CONCURRENCY, thread_name_prefix="lsw-image"
+)
+
+# Settings cache with TTL (monotonic clock, refilled by one coroutine at a time)
+_settings_cache = None
+_settings_cache_time = 0.0
+_SETTINGS_CACHE_TTL = 60
+_settings_lock: Optional[asyncio.Lock] = None
+_settings_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _settings_refill_lock() -> asyncio.Lock:
+    """Return the lock serialising settings reloads.
+
+    Created lazily so it belongs to the running event loop; separate
+    TestClients and lifespan restarts each run on a new loop.
+    """
+    global _settings_lock, _settings_lock_loop
+    loop = asyncio.get_running_loop()
+    if _settings_lock is None or _settings_lock_loop is not loop:
+        _settings_lock = asyncio.Lock()
+        _settings_lock_loop = loop
+    return _settings_lock
+
+
+def _settings_cache_fresh() -> bool:
+    return (
+        _settings_cache is not None
+        and time.monotonic() - _settings_cache_time <= _SETTINGS_CACHE_TTL
+    )
+
+
+async def get_cached_settings():
+    """Get cached settings or load fresh if cache expired."""
+    global _settings_cache, _settings_cache_time
+    if _settings_cache_fresh():
+        return _settings_cache
+
+    async with _settings_refill_lock():
+        # Another coroutine may have refilled the cache while we waited
+        if not _settings_cache_fresh():
+            loop = asyncio.get_running_loop()
+            _settings_cache = await loop.run_in_executor(executor, load_user_settings)
+            _settings_cache_time = time.monotonic()
+    return _settings_cache
+
+
+def clear_settings_cache() -> None:
+    """Drop cached settings so the next lookup reloads them from disk."""
+    global _settings_cache, _settings_cache_time
+    _settings_cache = None
+    _settings_cache_time = 0.0
+
+
+# World directories recently confirmed to exist, mapped to monotonic expiry.
+# Only positive results are cached; deleting a world must call forget_world_dir.
+_world_exists_cache: Dict[Path, float] = {}
+_WORLD_EXISTS_TTL = 5
+
+
+def is_known_world(world_path: Path) -> bool:
+    """Return True if world_path was confirmed to exist within the TTL."""
+    return _world_exists_cache.get(world_path, 0.0) > time.monotonic()
+
+
+def world_dir_exists(world_path: Path) -> bool:
+    """Check that a world directory exists, caching positive results."""
+    if is_known_world(world_path):
+        return True
+    if not world_path.exists():
+        return False
+    _world_exists_cache[world_path] = time.monotonic() + _WORLD_EXISTS_TTL
+    return True
+
+
+def forget_world_dir(world_path: Path) -> None:
+    """Drop a world directory from the existence and load caches."""
+    _world_exists_cache.pop(world_path, None)
+    _world_load_cache.pop(world_path, None)
+
+
+def forget_world(slug: str) -> None:
+    """Drop a world from the existence and load caches, e.g. after it is deleted."""
+    forget_world_dir(WORLDS_DIR / slug)
+
+
+# Parsed worlds for read-only endpoints, keyed by world directory and
+# validated against the config/state files' mtimes and sizes on every lookup
+_world_load_cache: Dict[Path, tuple] = {}
+
+
+def load_world_cached(
+    world_path: Path, loader: Callable[[str], tuple] = load_world
+) -> Tuple[WorldConfig, WorldState, dict]:
+    """Load a world for read-only use, reusing the last parse if unchanged.
+
+    Callers must not mutate the returned objects; anything that saves the
+    world should call load_world directly. save_world rewrites the files,
+    which changes their mtimes or sizes and invalidates the entry.
+
+    Args:
+        world_path: World directory; its name is the slug passed to loader
+        loader: Function that parses a world from its slug
+
+    Returns:
+        Tuple of (config, state, directories)
+    """
+    try:
+        config_stat = (world_path / "config.json").stat()
+        state_stat = (world_path / "world.json").stat()
+    except OSError:
+        return loader(world_path.name)
+    # Size as well as mtime, so a rewrite within one mtime tick (coarse
+    # filesystem timestamps, back-to-back saves) still invalidates the entry
+    stamp = (
+        config_stat.st_mtime_ns,
+        config_stat.st_size,
+        state_stat.st_mtime_ns,
+        state_stat.st_size,
+    )
+
+    cached = _world_load_cache.get(world_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    world = loader(world_path.name)
+    _world_load_cache[world_path] = (stamp, world)
+    return world
 
 
 def get_validated_world_slug(
@@ -38,7 +178,7 @@ def get_validated_world_slug(
         raise HTTPException(status_code=400, detail=str(e))
 
     world_path = WORLDS_DIR / validated_slug
-    if not world_path.exists():
+    if not world_dir_exists(world_path):
         raise HTTPException(status_code=404, detail="World not found")
 
     return validated_slug, world_path
@@ -53,7 +193,7 @@ async def load_world_async(slug: str) -> Tuple[WorldConfig, WorldState, dict]:
     Returns:
         Tuple of (config, state, directories)
     """
-    return await asyncio.get_event_loop().run_in_executor(executor, load_world, slug)
+    return await asyncio.get_running_loop().run_in_executor(executor, load_world, slug)
 
 
 async def get_world_data(
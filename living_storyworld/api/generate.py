@@ -1,18 +1,30 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import random
+import time
+from typing import Optional
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from ..providers import get_text_provider
+from ..providers.text import async_openai_client
+from ..settings import get_api_key_for_provider
+from .dependencies import GEN_CONCURRENCY, get_cached_settings
 
-router = APIRouter(prefix="/api/generate", tags=["generate"])
+logger = logging.getLogger(__name__)
 
-executor = ThreadPoolExecutor(max_workers=2)
+router = APIRouter(
+    prefix="/api/generate",
+    tags=["generate"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class ThemeResponse(BaseModel):
@@ -28,30 +40,219 @@ class WorldResponse(BaseModel):
     memory: str
 
 
-def _generate_random_theme() -> str:
+# Fallback themes if the API call fails
+_FALLBACK_THEMES = (
+    "A city of floating gardens suspended in eternal twilight",
+    "Underground libraries carved from crystalline caverns",
+    "A marketplace where memories are traded as currency",
+    "Steam-powered archipelago of migrating islands",
+    "Bioluminescent forests where trees sing at dawn",
+)
+
+
+# Private generator for world/theme picks, so nothing else seeding the global
+# random module can make "random" worlds repeat
+_rng = random.Random()
+
+# Pre-selected preset and style pack for guaranteed variety
+_PRESETS = (
+    "cozy-adventure",
+    "noir-mystery",
+    "epic-fantasy",
+    "solarpunk-explorer",
+    "gothic-horror",
+    "space-opera",
+    "slice-of-life",
+    "cosmic-horror",
+    "cyberpunk-noir",
+    "whimsical-fairy-tale",
+    "post-apocalyptic",
+    "historical-intrigue",
+)
+_STYLE_PACKS = (
+    "storybook-ink",
+    "watercolor-dream",
+    "pixel-rpg",
+    "comic-book",
+    "noir-sketch",
+    "art-nouveau",
+    "oil-painting",
+    "lowpoly-iso",
+)
+_MATURITY_LEVELS = ("general", "teen", "mature", "explicit")
+# Weighted random for maturity - heavily favor general/teen (50/35/12/3)
+_MATURITY_CUM_WEIGHTS = tuple(itertools.accumulate((50, 35, 12, 3)))
+
+# Fallback worlds with balanced distribution, used if the API call fails
+_FALLBACK_WORLDS = (
+    # Familiar concepts (50%)
+    {
+        "title": "Silverport Trading Company",
+        "theme": "A bustling harbor city where merchant guilds compete for trade routes to distant magical lands",
+        "style_pack": "watercolor-dream",
+        "preset": "cozy-adventure",
+        "maturity_level": "general",
+        "memory": "Silverport sits at the crossroads of three continents, where exotic spices, enchanted goods, and rare artifacts change hands daily. The five great trading companies maintain a delicate balance of power, each with their own fleet, secrets, and ambitions. Young merchants apprentice under guild masters, learning not just commerce but navigation, diplomacy, and the art of spotting a cursed trinket from a genuine treasure.",
+    },
+    {
+        "title": "Academy of Stars",
+        "theme": "A prestigious magical university where students master elemental magic and uncover ancient mysteries",
+        "style_pack": "storybook-ink",
+        "preset": "epic-fantasy",
+        "maturity_level": "general",
+        "memory": "The Academy stands on a floating island, its towers reaching toward the sky. Students are sorted into four houses based on their primary element: Fire, Water, Earth, or Air. The Grand Library holds thousands of spellbooks, some helpful, some dangerous, and a few that are strictly forbidden. This year, strange magical disturbances suggest something ancient is awakening beneath the school.",
+    },
+    {
+        "title": "The Wandering Inn",
+        "theme": "A magical inn that appears in different locations each night, serving travelers from across dimensions",
+        "style_pack": "pixel-rpg",
+        "preset": "slice-of-life",
+        "maturity_level": "general",
+        "memory": "The Crossroads Inn never stays in one place. Each sunrise it materializes somewhere new—a snowy mountain pass, a desert oasis, a bustling city square. The innkeeper welcomes all travelers, whether they're adventurers, merchants, or refugees from collapsing worlds. Regular patrons have learned to follow the signs: a blue lantern, a crow's call, the smell of fresh bread. Inside, the food is always warm, the beds always comfortable, and strangers become friends over shared tales.",
+    },
+    {
+        "title": "Starship Horizon",
+        "theme": "A generation ship's crew explores uncharted systems while maintaining their mobile home for thousands of colonists",
+        "style_pack": "lowpoly-iso",
+        "preset": "space-opera",
+        "maturity_level": "teen",
+        "memory": "The Horizon has been traveling for three generations, its 5,000 inhabitants living in rotating habitats while seeking a new Earth. The ship's crew discovers strange phenomena: abandoned alien stations, resource-rich asteroids, and signals that might be first contact. As resources dwindle and factions form, the captain must balance exploration with survival, all while the ship's AI begins displaying unexpected behaviors.",
+    },
+    # Interesting with a twist (30%)
+    {
+        "title": "The Library of Lost Voices",
+        "theme": "A vast library where forgotten stories manifest as living characters seeking someone to remember them",
+        "style_pack": "art-nouveau",
+        "preset": "whimsical-fairy-tale",
+        "maturity_level": "general",
+        "memory": "When a story is completely forgotten by the world, it appears in the Library—characters, settings, and all. The Archivists maintain this impossible place, helping faded heroes and villains find new readers before they dissolve entirely. But something is wrong: stories are vanishing faster than ever, and some characters are rewriting themselves, desperate to be remembered at any cost.",
+    },
+    {
+        "title": "Resonance City",
+        "theme": "A city where music is magic, and sound-shapers protect citizens from the silence that consumes reality",
+        "style_pack": "comic-book",
+        "preset": "solarpunk-explorer",
+        "maturity_level": "teen",
+        "memory": "Resonance was built on a frequency anomaly where sound waves can reshape matter. Musicians aren't just artists—they're engineers, healers, and warriors. The city hums with constant melody, from the bass rumble of the foundry-orchestras to the delicate chimes of the healing wards. But beyond the city walls lies the Dead Zone, where all sound is swallowed by an expanding silence that erases whatever it touches.",
+    },
+    # Unusual (15%)
+    {
+        "title": "The Gardeners",
+        "theme": "Reality is a garden tended by mysterious beings, and you've just been recruited as an apprentice gardener",
+        "style_pack": "watercolor-dream",
+        "preset": "cosmic-horror",
+        "maturity_level": "teen",
+        "memory": "The Gardeners move between worlds like farmers tending crops, pruning timelines, planting possibilities, and harvesting destinies. They exist outside causality, appearing as whatever form brings comfort. As an apprentice, you're learning to see reality as they do: a living, growing thing that needs care. But some Gardens are diseased, some have gone wild, and some are being invaded by something the Gardeners won't name.",
+    },
+    # Outlandish (5%)
+    {
+        "title": "The Dreaming City",
+        "theme": "A metropolis that exists only while people dream, built from collective unconscious and fading with each awakening",
+        "style_pack": "oil-painting",
+        "preset": "noir-mystery",
+        "maturity_level": "mature",
+        "memory": "Every night, millions of dreamers contribute to the City's existence—a skyscraper from Tokyo, a cafe from Paris, a park from memories of childhood. The permanent residents are those who've learned to never fully wake, navigating the shifting architecture and investigating crimes that blur the line between dream and reality. But recently, nightmares have been taking physical form, and some dreamers aren't waking up at all.",
+    },
+)
+
+
+# Upper bound on a theme/world LLM call, including the wait for a free slot,
+# before falling back; kept below the 45 s the web UI waits for
+# /api/generate/world so the fallback still arrives
+_LLM_TIMEOUT = 40.0
+
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_llm_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _llm_slots() -> asyncio.Semaphore:
+    """Return the semaphore capping concurrent theme/world LLM calls.
+
+    Created lazily so it belongs to the running event loop; sized by
+    LSW_GEN_CONCURRENCY like the chapter generation pools.
+    """
+    global _llm_semaphore, _llm_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _llm_semaphore is None or _llm_semaphore_loop is not loop:
+        _llm_semaphore = asyncio.Semaphore(GEN_CONCURRENCY)
+        _llm_semaphore_loop = loop
+    return _llm_semaphore
+
+
+class _CircuitBreaker:
+    """Skip the provider while it keeps failing instead of waiting out every call.
+
+    After failure_threshold consecutive failures the breaker opens and
+    allow() returns False for reset_timeout seconds. After that a single
+    probe call is let through; success closes the breaker, failure reopens it.
+    Only touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self.probe_inflight = False
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self.probe_inflight:
+            return False
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        self.probe_inflight = True
+        return True
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("Text provider recovered, closing circuit breaker")
+        self.failure_count = 0
+        self.opened_at = None
+        self.probe_inflight = False
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        if self.probe_inflight or self.failure_count >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(
+                    "Text provider failed %d times in a row, skipping it for %.0fs",
+                    self.failure_count,
+                    self.reset_timeout,
+                )
+            self.opened_at = time.monotonic()
+        self.probe_inflight = False
+
+    def release(self) -> None:
+        """Give up a probe that ended without a result (e.g. cancelled)."""
+        self.probe_inflight = False
+
+
+_world_breaker = _CircuitBreaker()
+
+
+async def _generate_random_theme() -> str:
     """Generate a random theme using OpenAI"""
     try:
-        import os
-
-        from openai import OpenAI
-
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a creative writing assistant. Generate unique, evocative themes for narrative storyworlds. Be creative, poetic, and specific. Each theme should be one concise sentence describing an interesting setting or concept.",
-                },
-                {
-                    "role": "user",
-                    "content": "Generate one unique and creative theme for a storyworld. Make it vivid and specific. Just the theme, no explanation.",
-                },
-            ],
-            temperature=1.2,
-            max_tokens=50,
-        )
+        client = async_openai_client(os.environ.get("OPENAI_API_KEY"))
+
+        async with asyncio.timeout(_LLM_TIMEOUT), _llm_slots():
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a creative writing assistant. Generate unique, evocative themes for narrative storyworlds. Be creative, poetic, and specific. Each theme should be one concise sentence describing an interesting setting or concept.",
+                    },
+                    {
+                        "role": "user",
+                        "content": "Generate one unique and creative theme for a storyworld. Make it vivid and specific. Just the theme, no explanation.",
+                    },
+                ],
+                temperature=1.2,
+                max_tokens=50,
+            )
 
         theme = response.choices[0].message.content.strip()
         # Remove quotes if present
@@ -59,69 +260,24 @@ def _generate_random_theme() -> str:
         return theme
 
     except Exception:
-        # Fallback themes if API fails
-        import random
-
-        fallbacks = [
-            "A city of floating gardens suspended in eternal twilight",
-            "Underground libraries carved from crystalline caverns",
-            "A marketplace where memories are traded as currency",
-            "Steam-powered archipelago of migrating islands",
-            "Bioluminescent forests where trees sing at dawn",
-        ]
-        return random.choice(fallbacks)
+        return _rng.choice(_FALLBACK_THEMES)
 
 
-def _generate_random_world() -> dict:
+async def _generate_random_world() -> dict:
     """Generate a complete random world configuration using configured text provider"""
     try:
-        import random
-        import time
-
-        from ..providers import get_text_provider
-        from ..settings import get_api_key_for_provider, load_user_settings
-
-        # Pre-select preset and style pack for guaranteed variety
-        presets = [
-            "cozy-adventure",
-            "noir-mystery",
-            "epic-fantasy",
-            "solarpunk-explorer",
-            "gothic-horror",
-            "space-opera",
-            "slice-of-life",
-            "cosmic-horror",
-            "cyberpunk-noir",
-            "whimsical-fairy-tale",
-            "post-apocalyptic",
-            "historical-intrigue",
-        ]
-        style_packs = [
-            "storybook-ink",
-            "watercolor-dream",
-            "pixel-rpg",
-            "comic-book",
-            "noir-sketch",
-            "art-nouveau",
-            "oil-painting",
-            "lowpoly-iso",
-        ]
-        maturity_levels = ["general", "teen", "mature", "explicit"]
-
         # Randomly select preset, style, and maturity level
-        selected_preset = random.choice(presets)
-        selected_style = random.choice(style_packs)
-        # Weighted random for maturity - favor general/teen
-        selected_maturity = random.choices(
-            maturity_levels, weights=[50, 35, 12, 3], k=1  # Heavily favor general/teen
+        selected_preset = _rng.choice(_PRESETS)
+        selected_style = _rng.choice(_STYLE_PACKS)
+        selected_maturity = _rng.choices(
+            _MATURITY_LEVELS, cum_weights=_MATURITY_CUM_WEIGHTS
         )[0]
 
         # Add entropy to the prompt to force variation
-        random_seed = random.randint(1000, 9999)
-        timestamp = int(time.time())
+        random_seed = _rng.randrange(1000, 10000)
 
         # Use the configured text provider, fallback to OpenAI if no key
-        settings = load_user_settings()
+        settings = await get_cached_settings()
         text_provider_name = settings.text_provider
         api_key = get_api_key_for_provider(text_provider_name, settings)
 
@@ -146,7 +302,7 @@ def _generate_random_world() -> dict:
                 "role": "system",
                 "content": f"""You are a creative world-building AI that generates diverse, engaging story world concepts.
 
-Seed: {random_seed} | Timestamp: {timestamp}
+Seed: {random_seed}
 
 The user has requested a world with these characteristics:
 - Narrative preset: {selected_preset}
@@ -174,10 +330,34 @@ Make everything cohesive with the selected preset and engaging. Most concepts sh
             },
         ]
 
-        # Generate using the provider
-        result = provider.generate(messages, temperature=0.9, model=model)
-
-        # Extract JSON from response (might be wrapped in markdown code blocks)
+        if not _world_breaker.allow():
+            logger.debug("Circuit breaker open, using fallback world")
+            return dict(_rng.choice(_FALLBACK_WORLDS))
+
+        # Generate using the provider; the deadline also covers waiting for a slot
+        called = False
+        try:
+            async with asyncio.timeout(_LLM_TIMEOUT), _llm_slots():
+                called = True
+                result = await provider.agenerate(
+                    messages,
+                    temperature=0.9,
+                    model=model,
+                    response_format={"type": "json_object"},
+                )
+        except Exception:
+            if called:
+                _world_breaker.record_failure()
+            else:
+                # Timed out queueing for a slot; the provider was never asked
+                _world_breaker.release()
+            raise
+        except BaseException:
+            _world_breaker.release()
+            raise
+        _world_breaker.record_success()
+
+        # Providers without JSON mode may still wrap the object in markdown code blocks
         content = result.content.strip()
         if content.startswith("```json"):
             content = content[7:]  # Remove ```json
@@ -187,7 +367,7 @@ Make everything cohesive with the selected preset and engaging. Most concepts sh
             content = content[:-3]  # Remove trailing ```
         content = content.strip()
 
-        world_config = json.loads(content)
+        world_config = orjson.loads(content)
 
         world_result = {
             "title": world_config.get("title", "Untitled World"),
@@ -209,93 +389,16 @@ Make everything cohesive with the selected preset and engaging. Most concepts sh
 
     except Exception as e:
         logger.warning("Random world generation failed, using fallback: %s", e)
-        # Fallback worlds with balanced distribution
-        import random
-
-        fallbacks = [
-            # Familiar concepts (50%)
-            {
-                "title": "Silverport Trading Company",
-                "theme": "A bustling harbor city where merchant guilds compete for trade routes to distant magical lands",
-                "style_pack": "watercolor-dream",
-                "preset": "cozy-adventure",
-                "maturity_level": "general",
-                "memory": "Silverport sits at the crossroads of three continents, where exotic spices, enchanted goods, and rare artifacts change hands daily. The five great trading companies maintain a delicate balance of power, each with their own fleet, secrets, and ambitions. Young merchants apprentice under guild masters, learning not just commerce but navigation, diplomacy, and the art of spotting a cursed trinket from a genuine treasure.",
-            },
-            {
-                "title": "Academy of Stars",
-                "theme": "A prestigious magical university where students master elemental magic and uncover ancient mysteries",
-                "style_pack": "storybook-ink",
-                "preset": "epic-fantasy",
-                "maturity_level": "general",
-                "memory": "The Academy stands on a floating island, its towers reaching toward the sky. Students are sorted into four houses based on their primary element: Fire, Water, Earth, or Air. The Grand Library holds thousands of spellbooks, some helpful, some dangerous, and a few that are strictly forbidden. This year, strange magical disturbances suggest something ancient is awakening beneath the school.",
-            },
-            {
-                "title": "The Wandering Inn",
-                "theme": "A magical inn that appears in different locations each night, serving travelers from across dimensions",
-                "style_pack": "pixel-rpg",
-                "preset": "slice-of-life",
-                "maturity_level": "general",
-                "memory": "The Crossroads Inn never stays in one place. Each sunrise it materializes somewhere new—a snowy mountain pass, a desert oasis, a bustling city square. The innkeeper welcomes all travelers, whether they're adventurers, merchants, or refugees from collapsing worlds. Regular patrons have learned to follow the signs: a blue lantern, a crow's call, the smell of fresh bread. Inside, the food is always warm, the beds always comfortable, and strangers become friends over shared tales.",
-            },
-            {
-                "title": "Starship Horizon",
-                "theme": "A generation ship's crew explores uncharted systems while maintaining their mobile home for thousands of colonists",
-                "style_pack": "lowpoly-iso",
-                "preset": "space-opera",
-                "maturity_level": "teen",
-                "memory": "The Horizon has been traveling for three generations, its 5,000 inhabitants living in rotating habitats while seeking a new Earth. The ship's crew discovers strange phenomena: abandoned alien stations, resource-rich asteroids, and signals that might be first contact. As resources dwindle and factions form, the captain must balance exploration with survival, all while the ship's AI begins displaying unexpected behaviors.",
-            },
-            # Interesting with a twist (30%)
-            {
-                "title": "The Library of Lost Voices",
-                "theme": "A vast library where forgotten stories manifest as living characters seeking someone to remember them",
-                "style_pack": "art-nouveau",
-                "preset": "whimsical-fairy-tale",
-                "maturity_level": "general",
-                "memory": "When a story is completely forgotten by the world, it appears in the Library—characters, settings, and all. The Archivists maintain this impossible place, helping faded heroes and villains find new readers before they dissolve entirely. But something is wrong: stories are vanishing faster than ever, and some characters are rewriting themselves, desperate to be remembered at any cost.",
-            },
-            {
-                "title": "Resonance City",
-                "theme": "A city where music is magic, and sound-shapers protect citizens from the silence that consumes reality",
-                "style_pack": "comic-book",
-                "preset": "solarpunk-explorer",
-                "maturity_level": "teen",
-                "memory": "Resonance was built on a frequency anomaly where sound waves can reshape matter. Musicians aren't just artists—they're engineers, healers, and warriors. The city hums with constant melody, from the bass rumble of the foundry-orchestras to the delicate chimes of the healing wards. But beyond the city walls lies the Dead Zone, where all sound is swallowed by an expanding silence that erases whatever it touches.",
-            },
-            # Unusual (15%)
-            {
-                "title": "The Gardeners",
-                "theme": "Reality is a garden tended by mysterious beings, and you've just been recruited as an apprentice gardener",
-                "style_pack": "watercolor-dream",
-                "preset": "cosmic-horror",
-                "maturity_level": "teen",
-                "memory": "The Gardeners move between worlds like farmers tending crops, pruning timelines, planting possibilities, and harvesting destinies. They exist outside causality, appearing as whatever form brings comfort. As an apprentice, you're learning to see reality as they do: a living, growing thing that needs care. But some Gardens are diseased, some have gone wild, and some are being invaded by something the Gardeners won't name.",
-            },
-            # Outlandish (5%)
-            {
-                "title": "The Dreaming City",
-                "theme": "A metropolis that exists only while people dream, built from collective unconscious and fading with each awakening",
-                "style_pack": "oil-painting",
-                "preset": "noir-mystery",
-                "maturity_level": "mature",
-                "memory": "Every night, millions of dreamers contribute to the City's existence—a skyscraper from Tokyo, a cafe from Paris, a park from memories of childhood. The permanent residents are those who've learned to never fully wake, navigating the shifting architecture and investigating crimes that blur the line between dream and reality. But recently, nightmares have been taking physical form, and some dreamers aren't waking up at all.",
-            },
-        ]
-        return random.choice(fallbacks)
+        return dict(_rng.choice(_FALLBACK_WORLDS))
 
 
 @router.get("/theme", response_model=ThemeResponse)
 async def generate_theme():
     """Generate a random theme using AI (legacy endpoint)"""
-    loop = asyncio.get_event_loop()
-    theme = await loop.run_in_executor(executor, _generate_random_theme)
-    return ThemeResponse(theme=theme)
+    return ThemeResponse(theme=await _generate_random_theme())
 
 
 @router.get("/world", response_model=WorldResponse)
 async def generate_world():
     """Generate a complete random world configuration using AI"""
-    loop = asyncio.get_event_loop()
-    world_data = await loop.run_in_executor(executor, _generate_random_world)
-    return WorldResponse(**world_data)
+    return WorldResponse(**await _generate_random_world())
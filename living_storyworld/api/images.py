@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -9,13 +9,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field, field_validator
 
 from ..image import generate_scene_image
-from .dependencies import get_validated_world_slug, load_world_async
+from ..settings import load_user_settings
+from ..world import find_chapter, save_world
+from .dependencies import get_validated_world_slug, image_executor, load_world_async
 
 router = APIRouter(prefix="/api/worlds/{slug}/images", tags=["images"])
 
-# Thread pool for running sync operations
-executor = ThreadPoolExecutor(max_workers=4)
-
 
 class ImageGenerateRequest(BaseModel):
     chapter: Optional[int] = Field(None, ge=1, description="Chapter number")
@@ -42,13 +41,13 @@ async def generate_image(
     prompt = request.prompt
     chapter_num = request.chapter
 
-    if chapter_num is not None and not prompt:
+    found = find_chapter(state, chapter_num) if chapter_num is not None else None
+
+    if found and not prompt:
         # Pull prompt from chapter record
-        for ch in state.chapters:
-            if ch.number == chapter_num:
-                # Prefer concise image_prompt, fallback to scene_prompt for backward compatibility
-                prompt = ch.image_prompt if hasattr(ch, 'image_prompt') and ch.image_prompt else ch.scene_prompt
-                break
+        ch = found[1]
+        # Prefer concise image_prompt, fallback to scene_prompt for backward compatibility
+        prompt = ch.image_prompt or ch.scene_prompt
 
     if not prompt:
         raise HTTPException(
@@ -56,14 +55,12 @@ async def generate_image(
         )
 
     # Generate image
-    from ..settings import load_user_settings
-
     settings = load_user_settings()
     image_model = settings.default_image_model
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     image_path = await loop.run_in_executor(
-        executor,
+        image_executor,
         generate_scene_image,
         dirs["base"],
         image_model,
@@ -74,23 +71,11 @@ async def generate_image(
         True,  # bypass_cache - always bypass when regenerating via API
     )
 
-    if chapter_num is not None:
-        for ch in state.chapters:
-            if ch.number == chapter_num:
-                import time
-
-                from ..settings import load_user_settings
-
-                ch.scene = f"/worlds/{slug}/media/scenes/{image_path.name}"
-                ch.generated_at = time.strftime("%Y-%m-%d %I:%M:%S %p")
-
-                settings = load_user_settings()
-                ch.image_model_used = settings.default_image_model
-
-                from ..world import save_world
-
-                save_world(slug, cfg, state, dirs)
-                break
+    if found:
+        ch = found[1]
+        ch.generated_at = time.strftime("%Y-%m-%d %I:%M:%S %p")
+        ch.image_model_used = image_model
+        save_world(slug, cfg, state, dirs)
 
     return {
         "scene": f"/worlds/{slug}/media/scenes/{image_path.name}",
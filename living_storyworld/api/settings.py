@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from ..settings import UserSettings, load_user_settings, save_user_settings
+from .dependencies import clear_settings_cache
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -221,6 +222,7 @@ async def update_settings(request: SettingsUpdateRequest):
         settings.reader_font_size = request.reader_font_size
 
     save_user_settings(settings)
+    clear_settings_cache()
 
     return {"message": "Settings updated"}
 
@@ -238,5 +240,6 @@ async def clear_api_keys():
             del os.environ[env_var]
 
     save_user_settings(settings)
+    clear_settings_cache()
 
     return {"message": "All API keys cleared"}
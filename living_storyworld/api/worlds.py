@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from ..storage import WORLDS_DIR, get_current_world, set_current_world
 from ..world import init_world, load_world
-from .dependencies import get_validated_world_slug
+from .dependencies import forget_world, get_validated_world_slug, load_world_cached
 
 router = APIRouter(prefix="/api/worlds", tags=["worlds"])
 
@@ -82,7 +82,7 @@ async def list_worlds():
     for world_dir in WORLDS_DIR.glob("*/"):
         if world_dir.is_dir():
             try:
-                cfg, state, _ = load_world(world_dir.name)
+                cfg, state, _ = load_world_cached(world_dir, load_world)
                 worlds.append(
                     WorldResponse(
                         title=cfg.title,
@@ -176,7 +176,7 @@ async def create_world(request: WorldCreateRequest):
 async def get_world(world_info: tuple[str, Path] = Depends(get_validated_world_slug)):
     """Get detailed world information including chapters"""
     slug, world_path = world_info
-    cfg, state, dirs = load_world(slug)
+    cfg, state, dirs = load_world_cached(world_path, load_world)
 
     # Load media index for scene images
     from ..storage import read_json
@@ -309,6 +309,7 @@ async def delete_world(
     import shutil
 
     shutil.rmtree(world_path)
+    forget_world(slug)
 
     # If this was the current world, unset it
     if get_current_world() == slug:
@@ -72,7 +72,7 @@ def cmd_chapter(args: argparse.Namespace) -> None:
     )
 
     # Update state
-    state.chapters.append(ch.__dict__)
+    state.chapters.append(ch)
     state.next_chapter += 1
     save_world(slug, cfg, state, dirs)
     print(
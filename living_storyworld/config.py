@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from pathlib import Path
 from typing import Dict
 
@@ -61,7 +60,7 @@ STYLE_PACKS: Dict[str, str] = {
 
 
 def save_config(path: Path, cfg: WorldConfig) -> None:
-    write_json(path, asdict(cfg))
+    write_json(path, cfg)
 
 
 def load_config(path: Path) -> WorldConfig:
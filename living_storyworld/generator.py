@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -245,6 +247,24 @@ def generate_chapter(
     make_scene_image: bool = True,
     chapter_length: str = "medium",
 ) -> Chapter:
+    chapter, _ = generate_chapter_with_markdown(
+        base_dir, cfg, state, make_scene_image, chapter_length
+    )
+    return chapter
+
+
+def generate_chapter_with_markdown(
+    base_dir: Path,
+    cfg: WorldConfig,
+    state: WorldState,
+    make_scene_image: bool = True,
+    chapter_length: str = "medium",
+) -> tuple[Chapter, str]:
+    """Generate a chapter and also return the markdown written to disk.
+
+    Callers that post-process the chapter text (e.g. summary generation) use
+    this to avoid re-reading the file they just wrote.
+    """
     from .settings import get_available_text_providers
 
     settings = load_user_settings()
@@ -392,7 +412,7 @@ def generate_chapter(
         prompt_for_image = image_prompt if image_prompt else scene_prompt
         _write_scene_request(base_dir, num, cfg.style_pack, prompt_for_image)
 
-    return ch
+    return ch, md
 
 
 def _extract_title(md: str) -> Optional[str]:
@@ -469,7 +489,11 @@ def _register_new_entities(
 
 
 async def infer_choice_reasoning(
-    choice_text: str, chapter_summary: str, world_theme: str, cfg: WorldConfig
+    choice_text: str,
+    chapter_summary: str,
+    world_theme: str,
+    cfg: WorldConfig,
+    executor: Optional[Executor] = None,
 ) -> str:
     """Use LLM to infer why the reader chose this option.
 
@@ -478,10 +502,26 @@ async def infer_choice_reasoning(
         chapter_summary: Summary of the chapter where the choice was made
         world_theme: The overall theme of the world
         cfg: World configuration for model settings
+        executor: Pool for the blocking provider call (the loop's default if None)
 
     Returns:
         A 1-2 sentence explanation of the narrative intent behind the choice
     """
+    # Provider SDKs block, so the call runs in a worker thread
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        _infer_choice_reasoning_sync,
+        choice_text,
+        chapter_summary,
+        world_theme,
+        cfg,
+    )
+
+
+def _infer_choice_reasoning_sync(
+    choice_text: str, chapter_summary: str, world_theme: str, cfg: WorldConfig
+) -> str:
     settings = load_user_settings()
     text_provider_name = settings.text_provider
     api_key = get_api_key_for_provider(text_provider_name, settings)
@@ -520,16 +560,27 @@ Reasoning:"""
         return f"The reader chose to {choice_text.lower()}"
 
 
-async def generate_chapter_summary(chapter_content: str, cfg: WorldConfig) -> str:
+async def generate_chapter_summary(
+    chapter_content: str, cfg: WorldConfig, executor: Optional[Executor] = None
+) -> str:
     """Use LLM to generate a concise summary of chapter events for story continuity.
 
     Args:
         chapter_content: The full text content of the chapter
         cfg: World configuration for model settings
+        executor: Pool for the blocking provider call (the loop's default if None)
 
     Returns:
         A 2-3 sentence summary of key events and developments
     """
+    # Provider SDKs block, so the call runs in a worker thread
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, _generate_chapter_summary_sync, chapter_content, cfg
+    )
+
+
+def _generate_chapter_summary_sync(chapter_content: str, cfg: WorldConfig) -> str:
     settings = load_user_settings()
     text_provider_name = settings.text_provider
     api_key = get_api_key_for_provider(text_provider_name, settings)
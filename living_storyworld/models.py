@@ -32,14 +32,14 @@ class Item:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Choice:
     id: str
     text: str
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     number: int
     title: str
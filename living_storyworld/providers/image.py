@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -155,6 +156,18 @@ class ImageProvider(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=4)
+def _replicate_client(api_token: str):
+    """Return a Replicate client for api_token, shared across generations.
+
+    The client holds an httpx connection pool, so reusing it keeps the TLS
+    connection to Replicate alive between images.
+    """
+    import replicate
+
+    return replicate.Client(api_token=api_token)
+
+
 class ReplicateProvider(ImageProvider):
     """Replicate image generation provider (Flux models)."""
 
@@ -183,13 +196,11 @@ class ReplicateProvider(ImageProvider):
             )
 
         try:
-            import replicate
+            client = _replicate_client(self.api_token)
         except ImportError as e:
             raise RuntimeError(
                 "Replicate SDK not installed. Run: pip install replicate>=1.0"
             ) from e
-
-        client = replicate.Client(api_token=self.api_token)
         model_name = model or self.get_default_model()
 
         # VALIDATION: Model name
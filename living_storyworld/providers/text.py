@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -24,6 +26,87 @@ def _init_api_key(
     return key
 
 
+# Shared AsyncOpenAI clients, one set per event loop: a client's httpx pool is
+# bound to the loop it first ran on, so it must not be handed to another loop
+# (e.g. a later asyncio.run in the CLI). Entries go away with their loop; the
+# web app closes its clients on shutdown via aclose_async_openai_clients().
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_MAX_ASYNC_CLIENTS = 8
+
+
+def async_openai_client(api_key: Optional[str], base_url: Optional[str] = None):
+    """Return the running loop's AsyncOpenAI client for (api_key, base_url).
+
+    The client owns an httpx connection pool, so reusing it keeps connections
+    to the provider alive between generations. Keyed by API key so a key
+    changed in settings gets a fresh client; past _MAX_ASYNC_CLIENTS the
+    oldest client is dropped from the cache but not closed, since a caller
+    may still be awaiting a request on it. The SDK closes its connection
+    pool once the last reference goes away. Must be called from a running
+    event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get((api_key, base_url))
+    if client is not None:
+        return client
+
+    from openai import AsyncOpenAI
+
+    if base_url:
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+    else:
+        client = AsyncOpenAI(api_key=api_key)
+
+    if len(clients) >= _MAX_ASYNC_CLIENTS:
+        del clients[next(iter(clients))]
+    clients[(api_key, base_url)] = client
+    return client
+
+
+async def aclose_async_openai_clients() -> None:
+    """Close the running loop's cached AsyncOpenAI clients (app shutdown)."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def _rejects_json_mode(e: Exception) -> bool:
+    """Whether e is a 400 complaining about response_format / JSON mode."""
+    if getattr(e, "status_code", None) != 400:
+        return False
+    detail = f"{e} {getattr(e, 'body', '')}".lower()
+    return "response_format" in detail or "json_object" in detail
+
+
+async def _create_chat_completion(
+    client, response_format: Optional[dict[str, str]] = None, **kwargs
+):
+    """Call chat.completions.create, requesting response_format if given.
+
+    Not every model behind an OpenAI-compatible API supports JSON mode; if the
+    request is rejected with a 400 that names response_format, it is retried
+    once without it so callers still get a (possibly fenced) plain-text answer.
+    Any other error, including unrelated 400s, is raised unchanged.
+    """
+    if response_format:
+        try:
+            return await client.chat.completions.create(
+                response_format=response_format, **kwargs
+            )
+        except Exception as e:
+            if not _rejects_json_mode(e):
+                raise
+            logger.info(
+                "Model %s rejected response_format, retrying without it: %s",
+                kwargs.get("model"),
+                e,
+            )
+    return await client.chat.completions.create(**kwargs)
+
+
 @dataclass
 class TextGenerationResult:
     """Result from text generation."""
@@ -56,6 +139,24 @@ class TextProvider(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+        response_format: Optional[dict[str, str]] = None,
+    ) -> TextGenerationResult:
+        """Async variant of generate().
+
+        Providers whose SDK has a native async client override this; the
+        default runs the blocking generate() in a worker thread.
+
+        Args:
+            response_format: Optional OpenAI-style response format, e.g.
+                {"type": "json_object"}. Providers without JSON mode ignore it.
+        """
+        return await asyncio.to_thread(self.generate, messages, temperature, model)
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
@@ -128,6 +229,40 @@ class OpenAICompatibleProvider(TextProvider):
             estimated_cost=cost,
         )
 
+    async def agenerate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+        response_format: Optional[dict[str, str]] = None,
+    ) -> TextGenerationResult:
+        try:
+            client = async_openai_client(self.api_key, self.get_base_url())
+        except ImportError as e:
+            raise RuntimeError(
+                "OpenAI SDK not installed. Run: pip install openai>=1.0"
+            ) from e
+
+        model_name = model or self.get_default_model()
+
+        resp = await _create_chat_completion(
+            client,
+            response_format,
+            model=model_name,
+            messages=messages,
+            temperature=temperature,
+        )
+
+        content = resp.choices[0].message.content or ""
+        cost = self.estimate_cost(messages, model_name)
+
+        return TextGenerationResult(
+            content=content,
+            provider=self.provider_name.lower(),
+            model=model_name,
+            estimated_cost=cost,
+        )
+
 
 class OpenAIProvider(TextProvider):
     """OpenAI text generation provider."""
@@ -147,13 +282,11 @@ class OpenAIProvider(TextProvider):
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = _init_api_key("OPENAI_API_KEY", "OpenAI", api_key)
 
-    def generate(
-        self,
-        messages: list[dict[str, str]],
-        temperature: float = 1.0,
-        model: Optional[str] = None,
-    ) -> TextGenerationResult:
-        from ..exceptions import InvalidModelError, handle_api_error
+    def _validate_request(
+        self, temperature: float, model: Optional[str]
+    ) -> tuple[str, float]:
+        """Validate model and temperature, returning the values to send."""
+        from ..exceptions import InvalidModelError
 
         # VALIDATION: Temperature bounds
         if not 0.0 <= temperature <= 2.0:
@@ -161,14 +294,6 @@ class OpenAIProvider(TextProvider):
                 f"Temperature must be between 0.0 and 2.0, got {temperature}"
             )
 
-        try:
-            from openai import OpenAI
-        except ImportError as e:
-            raise RuntimeError(
-                "OpenAI SDK not installed. Run: pip install openai>=1.0"
-            ) from e
-
-        client = OpenAI(api_key=self.api_key)
         model_name = model or self.get_default_model()
 
         # VALIDATION: Model name
@@ -191,6 +316,27 @@ class OpenAIProvider(TextProvider):
             )
             temperature = 2
 
+        return model_name, temperature
+
+    def generate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+    ) -> TextGenerationResult:
+        from ..exceptions import handle_api_error
+
+        model_name, temperature = self._validate_request(temperature, model)
+
+        try:
+            from openai import OpenAI
+        except ImportError as e:
+            raise RuntimeError(
+                "OpenAI SDK not installed. Run: pip install openai>=1.0"
+            ) from e
+
+        client = OpenAI(api_key=self.api_key)
+
         try:
             resp = client.chat.completions.create(
                 model=model_name,
@@ -211,6 +357,46 @@ class OpenAIProvider(TextProvider):
             estimated_cost=cost,
         )
 
+    async def agenerate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+        response_format: Optional[dict[str, str]] = None,
+    ) -> TextGenerationResult:
+        from ..exceptions import handle_api_error
+
+        model_name, temperature = self._validate_request(temperature, model)
+
+        try:
+            client = async_openai_client(self.api_key)
+        except ImportError as e:
+            raise RuntimeError(
+                "OpenAI SDK not installed. Run: pip install openai>=1.0"
+            ) from e
+
+        try:
+            resp = await _create_chat_completion(
+                client,
+                response_format,
+                model=model_name,
+                messages=messages,
+                temperature=temperature,
+            )
+        except Exception as e:
+            # Convert to user-friendly error
+            raise handle_api_error(e, "OpenAI") from e
+
+        content = resp.choices[0].message.content or ""
+        cost = self.estimate_cost(messages, model_name)
+
+        return TextGenerationResult(
+            content=content,
+            provider="openai",
+            model=model_name,
+            estimated_cost=cost,
+        )
+
     def get_default_model(self) -> str:
         return "gpt-5-mini"
 
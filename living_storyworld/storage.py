@@ -4,10 +4,11 @@ import json
 import logging
 import os
 import re
-from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 ROOT = Path(os.getcwd())
 WORLDS_DIR = ROOT / "worlds"
 CURRENT_FILE = ROOT / ".lsw_current"
@@ -29,11 +30,9 @@ def ensure_world_dirs(slug: str) -> Dict[str, Path]:
 
 
 def write_json(path: Path, data: Any) -> None:
-    if is_dataclass(data) and not isinstance(data, type):
-        data = asdict(data)  # type: ignore[arg-type]
+    """Write JSON with 2-space indent; dataclasses are serialized natively."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 def read_json(path: Path, default: Optional[Any] = None) -> Any:
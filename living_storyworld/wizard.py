@@ -75,7 +75,7 @@ def run_world_wizard() -> None:
         return
     cfg, state, dirs = load_world(slug)
     ch = generate_chapter(dirs["base"], cfg, state, make_scene_image=True)
-    state.chapters.append(ch.__dict__)
+    state.chapters.append(ch)
     state.next_chapter += 1
     save_world(slug, cfg, state, dirs)
     if ch.scene_prompt:
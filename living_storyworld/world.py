@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict
 from typing import Optional
 
 from .models import Chapter, Character, Choice, Item, Location, WorldConfig, WorldState
@@ -58,8 +57,8 @@ def init_world(
         items={},
         chapters=[],
     )
-    write_json(dirs["base"] / "config.json", asdict(cfg))
-    write_json(dirs["base"] / "world.json", asdict(state))
+    write_json(dirs["base"] / "config.json", cfg)
+    write_json(dirs["base"] / "world.json", state)
     set_current_world(slug)
     # Minimal web index placeholder
     (dirs["web"] / "index.html").write_text(
@@ -150,16 +149,42 @@ def load_world(slug: str) -> tuple[WorldConfig, WorldState, dict]:
         logging.error(f"Failed to validate world state for '{slug}': {e}")
         raise RuntimeError(f"World '{slug}' has corrupted state: {e}")
 
+    _build_chapter_index(state)
     return cfg, state, dirs
 
 
+def find_chapter(state: WorldState, chapter_num: int) -> Optional[tuple[int, Chapter]]:
+    """Return ``(index, chapter)`` for a chapter number, or None if absent.
+
+    Lookups go through a number→index map cached on the state. The map is
+    rebuilt whenever an entry is missing or no longer matches
+    ``state.chapters``, so appends, pops and replacements never return a
+    stale chapter.
+    """
+    index = getattr(state, "_chapter_index", None) or _build_chapter_index(state)
+    i = index.get(chapter_num)
+    if i is None or i >= len(state.chapters) or state.chapters[i].number != chapter_num:
+        i = _build_chapter_index(state).get(chapter_num)
+        if i is None:
+            return None
+    return i, state.chapters[i]
+
+
+def _build_chapter_index(state: WorldState) -> dict[int, int]:
+    index = {ch.number: i for i, ch in enumerate(state.chapters)}
+    # Not a dataclass field; the leading underscore is what keeps orjson (and so
+    # save_world) from writing it to world.json
+    state._chapter_index = index
+    return index
+
+
 def save_world(
     slug: str, cfg: WorldConfig, state: WorldState, dirs: Optional[dict] = None
 ) -> None:
     if dirs is None:
         dirs = ensure_world_dirs(slug)
-    write_json(dirs["base"] / "config.json", asdict(cfg))
-    write_json(dirs["base"] / "world.json", asdict(state))
+    write_json(dirs["base"] / "config.json", cfg)
+    write_json(dirs["base"] / "world.json", state)
 
 
 def tick_world(slug: str) -> int:
@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -20,12 +20,17 @@ from living_storyworld.api import chapters
 from living_storyworld.api.chapters import (
     ChapterGenerateRequest,
     ChoiceSelectionRequest,
-    get_cached_settings,
+    delete_chapter,
     get_chapter_content,
+    get_chapter_raw,
     select_choice,
     start_chapter_generation,
+    stream_chapter_progress,
 )
+from living_storyworld.api import dependencies
 from living_storyworld.api.dependencies import (
+    forget_world,
+    get_cached_settings,
     get_validated_world_slug,
     get_world_data,
     load_world_async,
@@ -93,6 +98,24 @@ class TestAPIDependencies:
                 get_validated_world_slug("nonexistent")
             assert exc.value.status_code == 404
 
+    def test_get_validated_world_slug_caches_existence(self, tmp_path):
+        """A confirmed world skips the stat until it is forgotten."""
+        from living_storyworld.api.dependencies import forget_world_dir
+
+        worlds_dir = tmp_path / "worlds"
+        worlds_dir.mkdir()
+        (worlds_dir / "test-world").mkdir()
+
+        with patch("living_storyworld.api.dependencies.WORLDS_DIR", worlds_dir):
+            get_validated_world_slug("test-world")
+            (worlds_dir / "test-world").rmdir()
+            assert get_validated_world_slug("test-world")[0] == "test-world"
+
+            forget_world_dir(worlds_dir / "test-world")
+            with pytest.raises(HTTPException) as exc:
+                get_validated_world_slug("test-world")
+            assert exc.value.status_code == 404
+
     @pytest.mark.asyncio
     async def test_load_world_async(self, sample_world_config, sample_world_state):
         """load_world_async runs load_world in executor."""
@@ -529,6 +552,371 @@ class TestChaptersAPI:
             assert "job_id" in response
             assert response["job_id"] in chapters.active_jobs
 
+    @pytest.mark.asyncio
+    async def test_stream_chapter_progress_frames(self):
+        """stream_chapter_progress yields encoded SSE frames until complete."""
+
+        channel = chapters.JobChannel()
+        chapters.active_jobs["job-frames"] = channel
+        response = await stream_chapter_progress("test-world", "job-frames")
+        stream = response.body_iterator
+
+        chapters._put_event(
+            channel, {"stage": "text", "percent": 10, "message": "Working"}
+        )
+        frames = [await stream.__anext__()]
+        chapters._put_event(
+            channel, {"stage": "complete", "percent": 100, "chapter": {"number": 1}}
+        )
+        frames += [frame async for frame in stream]
+
+        assert frames[0].startswith(b"event: progress\ndata: ")
+        assert json.loads(frames[0].split(b"data: ", 1)[1]) == {
+            "stage": "text",
+            "percent": 10,
+            "message": "Working",
+        }
+        assert frames[1] == b'event: complete\ndata: {"number":1}\n\n'
+        assert "job-frames" not in chapters.active_jobs
+
+    @pytest.mark.asyncio
+    async def test_stream_disconnect_closes_channel(self):
+        """Once the client disconnects, later job updates are dropped."""
+        channel = chapters.JobChannel()
+        chapters.active_jobs["job-gone"] = channel
+        response = await stream_chapter_progress("test-world", "job-gone")
+        stream = response.body_iterator
+
+        chapters._put_event(
+            channel, {"stage": "text", "percent": 10, "message": "Working"}
+        )
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert channel.closed
+        assert "job-gone" not in chapters.active_jobs
+        chapters._put_event(
+            channel, {"stage": "text", "percent": 20, "message": "Working"}
+        )
+        assert channel.empty()
+
+    @pytest.mark.asyncio
+    async def test_job_channel_keeps_latest_progress(self):
+        """Unread progress frames are replaced, and terminal frames supersede them."""
+        channel = chapters.JobChannel()
+        for percent in (10, 20, 30):
+            chapters._put_event(
+                channel, {"stage": "text", "percent": percent, "message": "Working"}
+            )
+        frame, is_final = channel.get_nowait()
+        assert b'"percent":30' in frame
+        assert is_final is False
+
+        chapters._put_event(
+            channel, {"stage": "text", "percent": 40, "message": "Working"}
+        )
+        chapters._put_event(channel, {"stage": "error", "error": "boom"})
+        frame, is_final = channel.get_nowait()
+        assert frame == b'event: error\ndata: {"error":"boom"}\n\n'
+        assert is_final is True
+
+    @pytest.mark.asyncio
+    async def test_job_channel_wakes_waiting_reader(self):
+        """A reader blocked on get() is handed the next frame directly."""
+        import asyncio
+
+        channel = chapters.JobChannel()
+        reader = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+        assert not reader.done()
+
+        chapters._put_event(channel, {"stage": "error", "error": "boom"})
+        frame, is_final = await asyncio.wait_for(reader, timeout=1)
+        assert frame.startswith(b"event: error\n")
+        assert is_final is True
+        assert channel.empty()
+
+    @pytest.mark.asyncio
+    async def test_unstreamed_job_is_reaped(self):
+        """Jobs whose stream is never opened are dropped after the job TTL."""
+        import asyncio
+
+        with patch.object(chapters, "_JOB_TTL", 0.01):
+            job_id, channel = chapters._register_job()
+            assert chapters.active_jobs[job_id] is channel
+            await asyncio.sleep(0.05)
+        assert job_id not in chapters.active_jobs
+
+    @pytest.mark.asyncio
+    async def test_job_registry_evicts_oldest(self):
+        """Registering past the job cap evicts the oldest registration."""
+        with patch.dict(chapters.active_jobs, clear=True), patch.object(
+            chapters, "_MAX_JOBS", 2
+        ):
+            first, _ = chapters._register_job()
+            second, _ = chapters._register_job()
+            third, _ = chapters._register_job()
+            assert list(chapters.active_jobs) == [second, third]
+            assert first not in chapters.active_jobs
+
+    @pytest.mark.asyncio
+    async def test_progress_ticker_until_cancelled(self):
+        """The progress ticker emits eased progress until its task is cancelled."""
+        import asyncio
+        import time
+
+        channel = chapters.JobChannel()
+        ticker = asyncio.create_task(
+            chapters._progress_ticker(
+                channel, "text", "Chapter text...", 10, 85, 40.0, time.monotonic()
+            )
+        )
+        frame, is_final = await asyncio.wait_for(channel.get(), timeout=1)
+        ticker.cancel()
+        await asyncio.gather(ticker, return_exceptions=True)
+
+        payload = json.loads(frame.split(b"data: ", 1)[1])
+        assert payload["stage"] == "text"
+        assert 10 <= payload["percent"] <= 85
+        assert payload["message"].startswith("Chapter text...")
+        assert is_final is False
+        assert ticker.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_progress_ticker_skips_unchanged_frames(self):
+        """Ticks that would render the same percent and seconds emit nothing."""
+        import asyncio
+        import time
+
+        channel = chapters.JobChannel()
+        with patch.object(chapters, "_PROGRESS_INTERVAL", 0.01):
+            ticker = asyncio.create_task(
+                chapters._progress_ticker(
+                    channel, "text", "Chapter text...", 10, 85, 1e6, time.monotonic()
+                )
+            )
+            await asyncio.wait_for(channel.get(), timeout=1)
+            await asyncio.sleep(0.05)
+            ticker.cancel()
+            await asyncio.gather(ticker, return_exceptions=True)
+
+        assert channel.empty()
+
+    @pytest.mark.asyncio
+    async def test_await_with_progress_updates_estimate(self):
+        """Stage estimates move toward observed durations."""
+        import asyncio
+        import time
+
+        with patch.dict(chapters._stage_estimates, {"text": 40.0}):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result("done")
+            result = await chapters._await_with_progress(
+                future,
+                chapters.JobChannel(),
+                "text",
+                "Chapter text...",
+                10,
+                85,
+                time.monotonic() - 20.0,
+            )
+            assert result == "done"
+            assert chapters._stage_estimates["text"] == pytest.approx(34.0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_await_with_progress_ignores_cache_hits(self):
+        """A near-instant stage (cached image) leaves the estimate alone."""
+        import asyncio
+        import time
+
+        with patch.dict(chapters._stage_estimates, {"image": 8.0}):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result("cached.png")
+            await chapters._await_with_progress(
+                future,
+                chapters.JobChannel(),
+                "image",
+                "Scene image...",
+                90,
+                93,
+                time.monotonic(),
+            )
+            assert chapters._stage_estimates["image"] == 8.0
+
+    @pytest.mark.asyncio
+    async def test_run_chapter_generation_completes(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """run_chapter_generation produces summary and image, then completes."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        world_dir = tmp_path / "test-world"
+        mock_dirs = {"base": world_dir}
+        new_chapter = Chapter(
+            number=2,
+            title="The Road",
+            filename="chapter-0002.md",
+            image_prompt="A winding road",
+            choices=[Choice(id="c1", text="Go left", description="Turn left")],
+            text_model_used="gpt-4",
+        )
+        settings = UserSettings(default_image_model="flux-dev")
+        sample_world_state.next_chapter = 2
+
+        with patch("living_storyworld.api.chapters.load_world") as mock_load, patch(
+            "living_storyworld.api.chapters.save_world"
+        ) as mock_save, patch(
+            "living_storyworld.api.chapters.generate_chapter_with_markdown",
+            return_value=(new_chapter, "# Chapter 2"),
+        ), patch(
+            "living_storyworld.api.chapters.generate_chapter_summary",
+            new=AsyncMock(return_value="A short summary"),
+        ) as mock_summary, patch(
+            "living_storyworld.api.chapters.generate_scene_image",
+            return_value=world_dir / "media" / "scenes" / "scene-0002-abc.png",
+        ), patch(
+            "living_storyworld.api.chapters.get_cached_settings",
+            new=AsyncMock(return_value=settings),
+        ):
+            mock_load.return_value = (sample_world_config, sample_world_state, mock_dirs)
+            channel = chapters.JobChannel()
+            job = asyncio.create_task(
+                chapters.run_chapter_generation(
+                    "test-world", ChapterGenerateRequest(), channel, "job-run"
+                )
+            )
+            is_final = False
+            while not is_final:
+                frame, is_final = await asyncio.wait_for(channel.get(), timeout=5)
+            await job
+
+        assert frame.startswith(b"event: complete\n")
+        data = json.loads(frame.split(b"data: ", 1)[1])
+        assert data["number"] == 2
+        assert data["scene"] == "/worlds/test-world/media/scenes/scene-0002-abc.png"
+        assert data["image_model_used"] == "flux-dev"
+        assert data["choices"] == [
+            {"id": "c1", "text": "Go left", "description": "Turn left"}
+        ]
+        assert new_chapter.ai_summary == "A short summary"
+        assert new_chapter.generated_at.endswith("Z")
+        assert "+00:00" not in new_chapter.generated_at
+        mock_summary.assert_awaited_once_with(
+            "# Chapter 2", sample_world_config, chapters.text_executor
+        )
+        assert sample_world_state.next_chapter == 3
+        assert sample_world_state.chapters[-1] is new_chapter
+        mock_save.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_run_chapter_generation_image_failure_cancels_summary(
+        self, tmp_path, sample_world_config, sample_world_state, caplog
+    ):
+        """A failed image stage cancels the in-flight summary and reports an error."""
+        import asyncio
+
+        summary_cancelled = asyncio.Event()
+
+        async def slow_summary(chapter_md, cfg, executor):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                summary_cancelled.set()
+                raise
+
+        new_chapter = Chapter(
+            number=2, title="The Road", filename="chapter-0002.md", image_prompt="Road"
+        )
+
+        with patch("living_storyworld.api.chapters.load_world") as mock_load, patch(
+            "living_storyworld.api.chapters.save_world"
+        ) as mock_save, patch(
+            "living_storyworld.api.chapters.generate_chapter_with_markdown",
+            return_value=(new_chapter, "# Chapter 2"),
+        ), patch(
+            "living_storyworld.api.chapters.generate_chapter_summary", new=slow_summary
+        ), patch(
+            "living_storyworld.api.chapters.generate_scene_image",
+            side_effect=RuntimeError("image provider down"),
+        ), patch(
+            "living_storyworld.api.chapters.get_cached_settings",
+            return_value=UserSettings(),
+        ):
+            mock_load.return_value = (
+                sample_world_config,
+                sample_world_state,
+                {"base": tmp_path},
+            )
+            channel = chapters.JobChannel()
+            job = asyncio.create_task(
+                chapters.run_chapter_generation(
+                    "test-world", ChapterGenerateRequest(), channel, "job-fail"
+                )
+            )
+            is_final = False
+            while not is_final:
+                frame, is_final = await asyncio.wait_for(channel.get(), timeout=5)
+            await job
+
+        assert frame.startswith(b"event: error\n")
+        assert summary_cancelled.is_set()
+        mock_save.assert_not_called()
+        # The provider error is logged, not the TaskGroup's ExceptionGroup wrapper
+        assert (
+            "Chapter generation failed: RuntimeError: image provider down"
+            in caplog.text
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_chapter_reroll_replaces_chapter(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """run_chapter_reroll swaps in the new chapter and keeps old metadata."""
+        import asyncio
+
+        world_dir = tmp_path / "test-world"
+        old_chapter = sample_world_state.chapters[0]
+        old_chapter.selected_choice_id = "choice-001"
+        old_chapter.ai_summary = "Old summary"
+        new_chapter = Chapter(number=5, title="Rewritten", filename="chapter-0005.md")
+
+        with patch("living_storyworld.api.chapters.load_world") as mock_load, patch(
+            "living_storyworld.api.chapters.save_world"
+        ), patch(
+            "living_storyworld.api.chapters.generate_chapter",
+            return_value=new_chapter,
+        ):
+            mock_load.return_value = (
+                sample_world_config,
+                sample_world_state,
+                {"base": world_dir},
+            )
+            channel = chapters.JobChannel()
+            job = asyncio.create_task(
+                chapters.run_chapter_reroll(
+                    "test-world",
+                    1,
+                    ChapterGenerateRequest(no_images=True),
+                    channel,
+                    "job-reroll",
+                )
+            )
+            is_final = False
+            while not is_final:
+                frame, is_final = await asyncio.wait_for(channel.get(), timeout=5)
+            await job
+
+        assert frame.startswith(b"event: complete\n")
+        data = json.loads(frame.split(b"data: ", 1)[1])
+        assert data["number"] == 1
+        assert data["title"] == "Rewritten"
+        assert data["filename"] == "chapter-0001.md"
+        assert data["selected_choice_id"] == "choice-001"
+        assert data["ai_summary"] == "Old summary"
+        assert sample_world_state.chapters == [new_chapter]
+        assert channel.empty()
+
     @pytest.mark.asyncio
     async def test_get_chapter_content_success(
         self, tmp_path, sample_world_config, sample_world_state
@@ -559,6 +947,40 @@ class TestChaptersAPI:
             response = await get_chapter_content("test-world", 1)
             assert response["content"] == "# Chapter 1\n\nContent here."
 
+    @pytest.mark.asyncio
+    async def test_get_chapter_raw(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """get_chapter_raw serves the markdown file, or 404s when it is missing."""
+        from fastapi.responses import FileResponse
+
+        world_dir = tmp_path / "test-world"
+        chapters_dir = world_dir / "chapters"
+        chapters_dir.mkdir(parents=True)
+        (chapters_dir / "chapter-0001.md").write_text("# Chapter 1")
+        sample_world_state.chapters = [
+            Chapter(number=1, title="One", filename="chapter-0001.md"),
+            Chapter(number=2, title="Two", filename="chapter-0002.md"),
+        ]
+
+        with patch("living_storyworld.api.chapters.WORLDS_DIR", tmp_path), patch(
+            "living_storyworld.api.chapters.load_world"
+        ) as mock_load:
+            mock_load.return_value = (
+                sample_world_config,
+                sample_world_state,
+                {"base": world_dir},
+            )
+
+            response = await get_chapter_raw("test-world", 1)
+            assert isinstance(response, FileResponse)
+            assert response.path == chapters_dir / "chapter-0001.md"
+            assert response.media_type.startswith("text/markdown")
+
+            with pytest.raises(HTTPException) as exc:
+                await get_chapter_raw("test-world", 2)
+            assert exc.value.status_code == 404
+
     @pytest.mark.asyncio
     async def test_get_chapter_content_not_found(
         self, tmp_path, sample_world_config, sample_world_state
@@ -673,36 +1095,177 @@ class TestChaptersAPI:
             assert exc.value.status_code == 400
             assert "Invalid choice ID" in exc.value.detail
 
-    def test_get_cached_settings_fresh(self):
+    @pytest.mark.asyncio
+    async def test_delete_chapter_removes_files(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """delete_chapter removes the chapter markdown and its scene images."""
+        world_dir = tmp_path / "test-world"
+        chapters_dir = world_dir / "chapters"
+        scenes_dir = world_dir / "media" / "scenes"
+        chapters_dir.mkdir(parents=True)
+        scenes_dir.mkdir(parents=True)
+        (chapters_dir / "chapter-0001.md").write_text("# Chapter 1")
+        (scenes_dir / "scene-0001-abc123.png").write_text("fake image")
+        (scenes_dir / "scene-0002-def456.png").write_text("other chapter")
+
+        mock_dirs = {"base": world_dir}
+        chapter = Chapter(number=1, title="Test", filename="chapter-0001.md")
+        sample_world_state.chapters = [chapter]
+
+        with patch("living_storyworld.api.chapters.WORLDS_DIR", tmp_path), patch(
+            "living_storyworld.api.chapters.load_world"
+        ) as mock_load, patch("living_storyworld.api.chapters.save_world") as mock_save:
+            mock_load.return_value = (sample_world_config, sample_world_state, mock_dirs)
+
+            response = await delete_chapter("test-world", 1)
+
+            assert response["success"] is True
+            assert not (chapters_dir / "chapter-0001.md").exists()
+            assert not (scenes_dir / "scene-0001-abc123.png").exists()
+            assert (scenes_dir / "scene-0002-def456.png").exists()
+            assert sample_world_state.chapters == []
+            mock_save.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_resolve_world_caches_existence(self, tmp_path):
+        """_resolve_world caches a positive existence check until forgotten."""
+        (tmp_path / "test-world").mkdir()
+
+        with patch("living_storyworld.api.chapters.WORLDS_DIR", tmp_path), patch(
+            "living_storyworld.api.dependencies.WORLDS_DIR", tmp_path
+        ):
+            assert await chapters._resolve_world("test-world") == "test-world"
+
+            (tmp_path / "test-world").rmdir()
+            assert await chapters._resolve_world("test-world") == "test-world"
+
+            forget_world("test-world")
+            with pytest.raises(HTTPException) as exc:
+                await chapters._resolve_world("test-world")
+            assert exc.value.status_code == 404
+
+    def test_load_world_cached_reuses_unchanged_world(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """_load_world_cached re-parses only when the world files change."""
+        world_dir = tmp_path / "test-world"
+        world_dir.mkdir()
+        (world_dir / "config.json").write_text("{}")
+        (world_dir / "world.json").write_text("{}")
+        world = (sample_world_config, sample_world_state, {"base": world_dir})
+
+        with patch("living_storyworld.api.chapters.WORLDS_DIR", tmp_path), patch(
+            "living_storyworld.api.dependencies.WORLDS_DIR", tmp_path
+        ), patch(
+            "living_storyworld.api.chapters.load_world", return_value=world
+        ) as mock_load:
+            assert chapters._load_world_cached("test-world") == world
+            assert chapters._load_world_cached("test-world") == world
+            assert mock_load.call_count == 1
+
+            stat = (world_dir / "world.json").stat()
+            os.utime(
+                world_dir / "world.json",
+                ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000),
+            )
+            chapters._load_world_cached("test-world")
+            assert mock_load.call_count == 2
+
+            # A same-tick rewrite keeps the mtime but changes the size
+            stat = (world_dir / "world.json").stat()
+            (world_dir / "world.json").write_text('{"tick": 1}')
+            os.utime(world_dir / "world.json", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            chapters._load_world_cached("test-world")
+            assert mock_load.call_count == 3
+
+            forget_world("test-world")
+            chapters._load_world_cached("test-world")
+            assert mock_load.call_count == 4
+
+    def test_find_latest_scene(self, tmp_path):
+        """_find_latest_scene picks the newest image for the chapter."""
+        scenes_dir = tmp_path / "scenes"
+        assert chapters._find_latest_scene(scenes_dir, 1) is None
+
+        scenes_dir.mkdir()
+        older = scenes_dir / "scene-0001-aaa.png"
+        newer = scenes_dir / "scene-0001-bbb.png"
+        other = scenes_dir / "scene-0002-ccc.png"
+        for i, path in enumerate((older, newer, other)):
+            path.write_text("fake image")
+            os.utime(path, (1000 + i, 1000 + i))
+
+        assert chapters._find_latest_scene(scenes_dir, 1) == newer
+        assert chapters._find_latest_scene(scenes_dir, 3) is None
+
+    @pytest.mark.asyncio
+    async def test_get_cached_settings_fresh(self):
         """get_cached_settings loads fresh settings when cache empty."""
         # Reset cache
-        chapters._settings_cache = None
-        chapters._settings_cache_time = 0
+        dependencies.clear_settings_cache()
 
         mock_settings = UserSettings(text_provider="openai")
 
         with patch(
-            "living_storyworld.api.chapters.load_user_settings",
+            "living_storyworld.api.dependencies.load_user_settings",
             return_value=mock_settings,
         ):
-            settings = get_cached_settings()
+            settings = await get_cached_settings()
             assert settings.text_provider == "openai"
 
-    def test_get_cached_settings_uses_cache(self):
+    @pytest.mark.asyncio
+    async def test_get_cached_settings_uses_cache(self):
         """get_cached_settings returns cached value within TTL."""
         import time
 
         mock_settings = UserSettings(text_provider="cached")
-        chapters._settings_cache = mock_settings
-        chapters._settings_cache_time = time.time()
+        dependencies._settings_cache = mock_settings
+        dependencies._settings_cache_time = time.monotonic()
 
         with patch(
-            "living_storyworld.api.chapters.load_user_settings"
+            "living_storyworld.api.dependencies.load_user_settings"
         ) as mock_load:
-            settings = get_cached_settings()
+            settings = await get_cached_settings()
             assert settings.text_provider == "cached"
             mock_load.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_get_cached_settings_single_flight(self):
+        """Concurrent lookups on an empty cache load settings only once."""
+        import asyncio
+
+        dependencies.clear_settings_cache()
+        mock_settings = UserSettings(text_provider="openai")
+
+        with patch(
+            "living_storyworld.api.dependencies.load_user_settings",
+            return_value=mock_settings,
+        ) as mock_load:
+            results = await asyncio.gather(*(get_cached_settings() for _ in range(5)))
+            assert all(r is mock_settings for r in results)
+            mock_load.assert_called_once()
+
+    def test_get_cached_settings_across_event_loops(self):
+        """The refill lock is per loop, so a new loop (e.g. TestClient) works."""
+        import asyncio
+
+        mock_settings = UserSettings(text_provider="openai")
+
+        async def contended_lookup():
+            dependencies.clear_settings_cache()
+            await asyncio.gather(*(get_cached_settings() for _ in range(3)))
+            return dependencies._settings_refill_lock()
+
+        with patch(
+            "living_storyworld.api.dependencies.load_user_settings",
+            return_value=mock_settings,
+        ):
+            first = asyncio.run(contended_lookup())
+            second = asyncio.run(contended_lookup())
+
+        assert first is not second
+
 
 # ============================================================================
 # Generate API Tests
@@ -712,31 +1275,42 @@ class TestChaptersAPI:
 class TestGenerateAPI:
     """Test api/generate.py functions."""
 
-    def test_generate_random_theme_success(self):
+    @pytest.mark.asyncio
+    async def test_generate_random_theme_success(self):
         """_generate_random_theme uses OpenAI to generate theme."""
+        from unittest.mock import AsyncMock
+
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content='"A city in the clouds"'))]
 
-        with patch("openai.OpenAI") as mock_openai, patch.dict(
+        with patch("openai.AsyncOpenAI") as mock_openai, patch.dict(
             os.environ, {"OPENAI_API_KEY": "sk-test"}
         ):
             mock_client = Mock()
-            mock_client.chat.completions.create.return_value = mock_response
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_openai.return_value = mock_client
 
-            theme = _generate_random_theme()
+            theme = await _generate_random_theme()
             assert theme == "A city in the clouds"
 
-    def test_generate_random_theme_fallback(self):
+            # The client is reused across calls with the same key
+            await _generate_random_theme()
+            mock_openai.assert_called_once_with(api_key="sk-test")
+
+    @pytest.mark.asyncio
+    async def test_generate_random_theme_fallback(self):
         """_generate_random_theme uses fallback on error."""
-        with patch("openai.OpenAI", side_effect=Exception("API error")):
-            theme = _generate_random_theme()
+        with patch("openai.AsyncOpenAI", side_effect=Exception("API error")):
+            theme = await _generate_random_theme()
             # Should be one of the fallback themes (non-empty string)
             assert len(theme) > 20  # Fallback themes are descriptive
             assert isinstance(theme, str)
 
-    def test_generate_random_world_success(self):
+    @pytest.mark.asyncio
+    async def test_generate_random_world_success(self):
         """_generate_random_world generates complete world config."""
+        from unittest.mock import AsyncMock
+
         mock_settings = UserSettings(
             text_provider="openai", default_text_model="gpt-4o-mini"
         )
@@ -750,32 +1324,212 @@ class TestGenerateAPI:
                 }
             )
         )
-        mock_provider.generate.return_value = mock_result
+        mock_provider.agenerate = AsyncMock(return_value=mock_result)
 
         with patch(
-            "living_storyworld.settings.load_user_settings",
-            return_value=mock_settings,
+            "living_storyworld.api.generate.get_cached_settings",
+            new=AsyncMock(return_value=mock_settings),
         ), patch(
-            "living_storyworld.settings.get_api_key_for_provider",
+            "living_storyworld.api.generate.get_api_key_for_provider",
             return_value="sk-test",
         ), patch(
-            "living_storyworld.providers.get_text_provider",
+            "living_storyworld.api.generate.get_text_provider",
             return_value=mock_provider,
         ):
-            world = _generate_random_world()
+            world = await _generate_random_world()
 
             assert world["title"] == "Test World"
             assert world["theme"] == "A test theme"
             assert "style_pack" in world
             assert "preset" in world
 
-    def test_generate_random_world_fallback(self):
+    @pytest.mark.asyncio
+    async def test_generate_random_world_bounds_concurrent_calls(self, monkeypatch):
+        """Concurrent world generations share the LLM concurrency limit."""
+        import asyncio
+
+        from living_storyworld.api import generate as generate_module
+
+        monkeypatch.setattr(generate_module, "GEN_CONCURRENCY", 2)
+        monkeypatch.setattr(generate_module, "_llm_semaphore", None)
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_agenerate(messages, temperature, model, response_format):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(content=json.dumps({"title": "T", "theme": "X", "memory": ""}))
+
+        mock_provider = Mock()
+        mock_provider.agenerate = fake_agenerate
+
+        with patch(
+            "living_storyworld.api.generate.get_cached_settings",
+            new=AsyncMock(return_value=UserSettings(text_provider="openai")),
+        ), patch(
+            "living_storyworld.api.generate.get_api_key_for_provider",
+            return_value="sk-test",
+        ), patch(
+            "living_storyworld.api.generate.get_text_provider",
+            return_value=mock_provider,
+        ):
+            worlds = await asyncio.gather(
+                *(_generate_random_world() for _ in range(5))
+            )
+
+        assert [w["title"] for w in worlds] == ["T"] * 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_random_world_queued_caller_falls_back(self, monkeypatch):
+        """A caller stuck behind the concurrency cap falls back on its deadline."""
+        import asyncio
+
+        from living_storyworld.api import generate as generate_module
+
+        monkeypatch.setattr(generate_module, "GEN_CONCURRENCY", 1)
+        monkeypatch.setattr(generate_module, "_llm_semaphore", None)
+        monkeypatch.setattr(generate_module, "_LLM_TIMEOUT", 5.0)
+        monkeypatch.setattr(
+            generate_module, "_world_breaker", generate_module._CircuitBreaker()
+        )
+
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def slow_agenerate(messages, temperature, model, response_format):
+            started.set()
+            await finish.wait()
+            return Mock(content=json.dumps({"title": "T", "theme": "X", "memory": ""}))
+
+        mock_provider = Mock()
+        mock_provider.agenerate = Mock(side_effect=slow_agenerate)
+
+        with patch(
+            "living_storyworld.api.generate.get_cached_settings",
+            new=AsyncMock(return_value=UserSettings(text_provider="openai")),
+        ), patch(
+            "living_storyworld.api.generate.get_api_key_for_provider",
+            return_value="sk-test",
+        ), patch(
+            "living_storyworld.api.generate.get_text_provider",
+            return_value=mock_provider,
+        ):
+            holder = asyncio.create_task(_generate_random_world())
+            await started.wait()
+
+            # The only slot is busy, so this caller queues until its deadline
+            monkeypatch.setattr(generate_module, "_LLM_TIMEOUT", 0.05)
+            queued = await _generate_random_world()
+
+            finish.set()
+            held = await holder
+
+        assert queued["title"] in [w["title"] for w in generate_module._FALLBACK_WORLDS]
+        assert held["title"] == "T"
+        assert mock_provider.agenerate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slot_wait_counts_toward_llm_timeout(self, monkeypatch):
+        """With every LLM slot taken, the fallback still arrives on the deadline."""
+        import asyncio
+        import time
+
+        from living_storyworld.api import generate as generate_module
+
+        monkeypatch.setattr(generate_module, "GEN_CONCURRENCY", 1)
+        monkeypatch.setattr(generate_module, "_llm_semaphore", None)
+        monkeypatch.setattr(generate_module, "_LLM_TIMEOUT", 0.05)
+        breaker = generate_module._CircuitBreaker()
+        monkeypatch.setattr(generate_module, "_world_breaker", breaker)
+
+        mock_provider = Mock()
+        mock_provider.agenerate = AsyncMock()
+
+        slots = generate_module._llm_slots()
+        await slots.acquire()
+        try:
+            with patch(
+                "living_storyworld.api.generate.get_cached_settings",
+                new=AsyncMock(return_value=UserSettings(text_provider="openai")),
+            ), patch(
+                "living_storyworld.api.generate.get_api_key_for_provider",
+                return_value="sk-test",
+            ), patch(
+                "living_storyworld.api.generate.get_text_provider",
+                return_value=mock_provider,
+            ), patch("openai.AsyncOpenAI"), patch.dict(
+                os.environ, {"OPENAI_API_KEY": "sk-test"}
+            ):
+                start = time.monotonic()
+                world, theme = await asyncio.gather(
+                    _generate_random_world(), _generate_random_theme()
+                )
+                elapsed = time.monotonic() - start
+        finally:
+            slots.release()
+
+        assert elapsed < 1.0
+        assert world["title"] in [w["title"] for w in generate_module._FALLBACK_WORLDS]
+        assert theme in generate_module._FALLBACK_THEMES
+        mock_provider.agenerate.assert_not_awaited()
+        # Queueing for a slot is not a provider failure
+        assert breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_random_world_circuit_breaker(self, monkeypatch):
+        """Repeated provider failures open the breaker and skip the provider."""
+        from unittest.mock import AsyncMock
+
+        from living_storyworld.api import generate as generate_module
+
+        breaker = generate_module._CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        monkeypatch.setattr(generate_module, "_world_breaker", breaker)
+
+        mock_provider = Mock()
+        mock_provider.agenerate = AsyncMock(side_effect=RuntimeError("outage"))
+
+        with patch(
+            "living_storyworld.api.generate.get_cached_settings",
+            new=AsyncMock(return_value=UserSettings(text_provider="openai")),
+        ), patch(
+            "living_storyworld.api.generate.get_api_key_for_provider",
+            return_value="sk-test",
+        ), patch(
+            "living_storyworld.api.generate.get_text_provider",
+            return_value=mock_provider,
+        ):
+            for _ in range(4):
+                world = await _generate_random_world()
+                assert "title" in world
+
+            assert mock_provider.agenerate.await_count == 2
+
+            # After the reset timeout one probe goes through and closes the breaker
+            breaker.opened_at -= 60
+            mock_provider.agenerate = AsyncMock(
+                return_value=Mock(
+                    content=json.dumps({"title": "Back", "theme": "X", "memory": ""})
+                )
+            )
+            world = await _generate_random_world()
+
+        assert world["title"] == "Back"
+        assert breaker.opened_at is None
+        assert breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_random_world_fallback(self):
         """_generate_random_world uses fallback on error."""
         with patch(
-            "living_storyworld.settings.load_user_settings",
-            side_effect=Exception("Settings error"),
+            "living_storyworld.api.generate.get_cached_settings",
+            new=AsyncMock(side_effect=Exception("Settings error")),
         ):
-            world = _generate_random_world()
+            world = await _generate_random_world()
             # Should be one of the fallback worlds
             assert "title" in world
             assert "theme" in world
@@ -784,9 +1538,11 @@ class TestGenerateAPI:
     @pytest.mark.asyncio
     async def test_generate_theme_endpoint(self):
         """generate_theme endpoint returns theme."""
+        from unittest.mock import AsyncMock
+
         with patch(
             "living_storyworld.api.generate._generate_random_theme",
-            return_value="Test theme",
+            new=AsyncMock(return_value="Test theme"),
         ):
             response = await generate_theme()
             assert response.theme == "Test theme"
@@ -803,9 +1559,11 @@ class TestGenerateAPI:
             "memory": "Lore",
         }
 
+        from unittest.mock import AsyncMock
+
         with patch(
             "living_storyworld.api.generate._generate_random_world",
-            return_value=mock_world,
+            new=AsyncMock(return_value=mock_world),
         ):
             response = await generate_world()
             assert response.title == "Test World"
@@ -835,7 +1593,7 @@ class TestImagesAPI:
         mock_settings = UserSettings(default_image_model="flux-schnell")
 
         with patch("living_storyworld.api.images.load_world_async") as mock_load, patch(
-            "living_storyworld.settings.load_user_settings", return_value=mock_settings
+            "living_storyworld.api.images.load_user_settings", return_value=mock_settings
         ), patch(
             "living_storyworld.api.images.generate_scene_image",
             return_value=mock_image_path,
@@ -877,13 +1635,13 @@ class TestImagesAPI:
         sample_world_state.chapters = [chapter]
 
         with patch("living_storyworld.api.images.load_world_async") as mock_load, patch(
-            "living_storyworld.settings.load_user_settings", return_value=mock_settings
+            "living_storyworld.api.images.load_user_settings", return_value=mock_settings
         ), patch(
             "living_storyworld.api.images.generate_scene_image",
             return_value=mock_image_path,
         ) as mock_gen, patch(
-            "living_storyworld.world.save_world"
-        ):
+            "living_storyworld.api.images.save_world"
+        ) as mock_save:
             mock_load.return_value = (sample_world_config, sample_world_state, mock_dirs)
 
             request = ImageGenerateRequest(chapter=1)
@@ -895,6 +1653,8 @@ class TestImagesAPI:
             mock_gen.assert_called_once()
             call_args = mock_gen.call_args[0]
             assert call_args[3] == "Chapter scene prompt"  # prompt argument
+            assert chapter.image_model_used == "flux-schnell"
+            mock_save.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_generate_image_no_prompt_error(
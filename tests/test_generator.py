@@ -9,6 +9,7 @@ from living_storyworld.generator import (
     _register_new_entities,
     _write_scene_request,
     generate_chapter,
+    generate_chapter_with_markdown,
     infer_choice_reasoning,
     generate_chapter_summary,
 )
@@ -527,6 +528,37 @@ Once upon a time..."""
         chapter_file = tmp_path / "chapters" / "chapter-0001.md"
         assert chapter_file.exists()
 
+    def test_generate_chapter_with_markdown(
+        self, tmp_path, sample_world_config, sample_world_state
+    ):
+        """Test the markdown written to disk is also returned to the caller."""
+        (tmp_path / "chapters").mkdir()
+        mock_text_provider = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = "# The Beginning\n\nOnce upon a time..."
+        mock_response.model = "gpt-4"
+        mock_response.estimated_cost = 0.01
+        mock_text_provider.generate.return_value = mock_response
+        mock_text_provider.get_default_model.return_value = "gpt-4"
+
+        with patch("living_storyworld.generator.load_user_settings") as mock_settings, \
+             patch("living_storyworld.settings.get_available_text_providers") as mock_avail, \
+             patch("living_storyworld.settings.get_api_key_for_provider") as mock_key, \
+             patch("living_storyworld.generator.get_text_provider") as mock_get_provider:
+
+            mock_settings.return_value = MagicMock(global_instructions="")
+            mock_avail.return_value = ["openai"]
+            mock_key.return_value = "test-key"
+            mock_get_provider.return_value = mock_text_provider
+
+            chapter, markdown = generate_chapter_with_markdown(
+                tmp_path, sample_world_config, sample_world_state
+            )
+
+        assert chapter.title == "The Beginning"
+        assert markdown == mock_response.content
+        assert (tmp_path / "chapters" / chapter.filename).read_text() == markdown
+
     def test_generate_chapter_no_providers(
         self, tmp_path, sample_world_config, sample_world_state
     ):
@@ -746,3 +778,71 @@ class TestGenerateChapterSummary:
 
         assert len(summary) <= 300
         assert summary.endswith("...")
+
+    async def test_generate_summary_does_not_block_event_loop(self, sample_world_config):
+        """The blocking provider call runs off the event loop."""
+        import asyncio
+        import time
+
+        mock_provider = MagicMock()
+
+        def slow_generate(*args, **kwargs):
+            time.sleep(0.2)
+            return MagicMock(content="Summary")
+
+        mock_provider.generate.side_effect = slow_generate
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        with patch("living_storyworld.generator.load_user_settings") as mock_settings, \
+             patch("living_storyworld.generator.get_api_key_for_provider"), \
+             patch("living_storyworld.generator.get_text_provider") as mock_get_provider:
+
+            mock_settings.return_value = MagicMock(
+                text_provider="openai",
+                default_text_model="gpt-4",
+            )
+            mock_get_provider.return_value = mock_provider
+
+            task = asyncio.create_task(ticker())
+            summary = await generate_chapter_summary("Content", sample_world_config)
+            task.cancel()
+
+        assert summary == "Summary"
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_uses_given_executor(self, sample_world_config):
+        """The provider call runs on the executor the caller passes in."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_provider = MagicMock()
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return MagicMock(content="Summary")
+
+        mock_provider.generate.side_effect = record_thread
+
+        with patch("living_storyworld.generator.load_user_settings") as mock_settings, \
+             patch("living_storyworld.generator.get_api_key_for_provider"), \
+             patch("living_storyworld.generator.get_text_provider") as mock_get_provider, \
+             ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-text") as pool:
+
+            mock_settings.return_value = MagicMock(
+                text_provider="openai",
+                default_text_model="gpt-4",
+            )
+            mock_get_provider.return_value = mock_provider
+
+            summary = await generate_chapter_summary("Content", sample_world_config, pool)
+
+        assert summary == "Summary"
+        assert threads and threads[0].startswith("test-text")
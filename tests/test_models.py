@@ -1,4 +1,7 @@
 from dataclasses import asdict
+
+import pytest
+
 from living_storyworld.models import (
     Character, Location, Item, Choice, Chapter, WorldState, WorldConfig
 )
@@ -79,6 +82,12 @@ class TestDataclassSerialization:
         restored = Chapter(**data)
         assert restored == chapter
 
+    def test_chapter_rejects_unknown_attributes(self):
+        """Chapters are slotted, so stray attributes can't leak into world.json."""
+        chapter = Chapter(number=1, title="Test", filename="chapter-0001.md")
+        with pytest.raises(AttributeError):
+            chapter.scene = "/worlds/test/media/scenes/x.png"
+
     def test_world_state_roundtrip(self):
         state = WorldState(
             tick=5,
@@ -183,6 +183,180 @@ class TestTextProviderGeneration:
             assert result.model in provider.ALLOWED_MODELS
             assert result.estimated_cost >= 0
 
+    @pytest.mark.asyncio
+    async def test_openai_agenerate_uses_async_client(self):
+        """OpenAI agenerate awaits the shared AsyncOpenAI client."""
+        from unittest.mock import AsyncMock
+
+        provider = OpenAIProvider(api_key="sk-test")
+
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Async text"))]
+
+        with patch("openai.AsyncOpenAI") as mock_openai:
+            mock_openai.return_value.chat.completions.create = AsyncMock(
+                return_value=mock_response
+            )
+
+            for _ in range(2):
+                result = await provider.agenerate(
+                    [{"role": "user", "content": "test"}], model="gpt-4o-mini"
+                )
+
+            assert result.content == "Async text"
+            assert result.provider == "openai"
+            mock_openai.assert_called_once_with(api_key="sk-test")
+            create = mock_openai.return_value.chat.completions.create
+            assert "response_format" not in create.call_args.kwargs
+
+            await provider.agenerate(
+                [{"role": "user", "content": "Return JSON"}],
+                model="gpt-4o-mini",
+                response_format={"type": "json_object"},
+            )
+            assert create.call_args.kwargs["response_format"] == {
+                "type": "json_object"
+            }
+
+    def test_async_clients_are_per_loop_and_closed_on_shutdown(self):
+        """Each event loop gets its own AsyncOpenAI client, closed by aclose."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from living_storyworld.providers.text import (
+            aclose_async_openai_clients,
+            async_openai_client,
+        )
+
+        async def use_and_close():
+            client = async_openai_client("sk-test")
+            assert async_openai_client("sk-test") is client
+            await aclose_async_openai_clients()
+            return client
+
+        with patch("openai.AsyncOpenAI") as mock_openai:
+            mock_openai.side_effect = lambda **kw: Mock(close=AsyncMock())
+            first = asyncio.run(use_and_close())
+            second = asyncio.run(use_and_close())
+
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_evicted_async_client_survives_pending_call(self):
+        """Evicting a client from the cache does not close it under a caller."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from living_storyworld.providers import text as text_module
+
+        release = asyncio.Event()
+
+        async def pending_create(**kwargs):
+            await release.wait()
+            return "done"
+
+        def make_client(**kwargs):
+            client = Mock(close=AsyncMock())
+            client.chat.completions.create = pending_create
+            return client
+
+        with patch("openai.AsyncOpenAI", side_effect=make_client):
+            first = text_module.async_openai_client("sk-0")
+            call = asyncio.create_task(first.chat.completions.create(model="m"))
+            await asyncio.sleep(0)
+
+            for i in range(1, text_module._MAX_ASYNC_CLIENTS + 1):
+                text_module.async_openai_client(f"sk-{i}")
+            await asyncio.sleep(0)
+
+            assert text_module.async_openai_client("sk-0") is not first
+            first.close.assert_not_awaited()
+            release.set()
+            assert await call == "done"
+
+    @pytest.mark.asyncio
+    async def test_agenerate_retries_without_rejected_json_mode(self):
+        """A 400 for response_format is retried once without JSON mode."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+        import openai
+
+        provider = TogetherAIProvider(api_key="test-key")
+
+        rejected = openai.BadRequestError(
+            "response_format is not supported by this model",
+            response=httpx.Response(
+                400, request=httpx.Request("POST", "https://example.com")
+            ),
+            body=None,
+        )
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content='{"title": "T"}'))]
+
+        with patch("openai.AsyncOpenAI") as mock_openai:
+            create = AsyncMock(side_effect=[rejected, mock_response])
+            mock_openai.return_value.chat.completions.create = create
+
+            result = await provider.agenerate(
+                [{"role": "user", "content": "Return JSON"}],
+                response_format={"type": "json_object"},
+            )
+
+        assert result.content == '{"title": "T"}'
+        assert create.await_count == 2
+        assert create.await_args_list[0].kwargs["response_format"] == {
+            "type": "json_object"
+        }
+        assert "response_format" not in create.await_args_list[1].kwargs
+
+    @pytest.mark.asyncio
+    async def test_agenerate_does_not_retry_unrelated_400(self):
+        """A 400 that isn't about response_format is raised without a retry."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+        import openai
+
+        provider = TogetherAIProvider(api_key="test-key")
+
+        too_long = openai.BadRequestError(
+            "This model's maximum context length is 8192 tokens",
+            response=httpx.Response(
+                400, request=httpx.Request("POST", "https://example.com")
+            ),
+            body={"code": "context_length_exceeded"},
+        )
+
+        with patch("openai.AsyncOpenAI") as mock_openai:
+            create = AsyncMock(side_effect=too_long)
+            mock_openai.return_value.chat.completions.create = create
+
+            with pytest.raises(openai.BadRequestError) as exc:
+                await provider.agenerate(
+                    [{"role": "user", "content": "Return JSON"}],
+                    response_format={"type": "json_object"},
+                )
+
+        assert exc.value is too_long
+        assert create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_agenerate_defaults_to_sync_generate(self):
+        """Providers without an async SDK fall back to generate() in a thread."""
+        provider = GeminiProvider(api_key="test-key")
+        expected = TextGenerationResult(
+            content="text", provider="gemini", model="m", estimated_cost=0.0
+        )
+
+        with patch.object(provider, "generate", return_value=expected) as mock_gen:
+            result = await provider.agenerate([{"role": "user", "content": "test"}])
+
+        assert result is expected
+        mock_gen.assert_called_once()
+
     def test_gemini_generate_success(self):
         """Gemini provider generates text."""
         provider = GeminiProvider(api_key="test-key")
@@ -282,6 +456,25 @@ class TestImageProviderMethods:
         model = provider.get_default_model()
         assert "flux" in model.lower()
 
+    def test_replicate_reuses_client(self, tmp_path):
+        """Replicate generations with the same token share one SDK client."""
+        from living_storyworld.providers.image import _replicate_client
+
+        _replicate_client.cache_clear()
+        with patch("replicate.Client") as mock_client_cls, patch(
+            "living_storyworld.providers.image._safe_download_image"
+        ):
+            mock_client_cls.return_value.run.return_value = ["https://example.com/a.png"]
+
+            for _ in range(2):
+                ReplicateProvider(api_key="r8_test").generate(
+                    "A sunset", tmp_path / "test.png"
+                )
+
+            mock_client_cls.assert_called_once_with(api_token="r8_test")
+            assert mock_client_cls.return_value.run.call_count == 2
+        _replicate_client.cache_clear()
+
     def test_pollinations_aspect_ratio_conversion(self):
         """Pollinations converts aspect ratios correctly."""
         provider = PollinationsProvider()
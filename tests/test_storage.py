@@ -1,5 +1,6 @@
 import pytest
-from living_storyworld.storage import slugify, validate_slug
+from living_storyworld.models import Chapter, WorldState
+from living_storyworld.storage import read_json, slugify, validate_slug, write_json
 
 
 class TestSlugify:
@@ -104,3 +105,19 @@ class TestValidateSlug:
     def test_hyphens_allowed_in_middle(self):
         assert validate_slug("my-long-world-name") == "my-long-world-name"
         assert validate_slug("test-123-abc") == "test-123-abc"
+
+
+class TestWriteJson:
+    """Test JSON persistence."""
+
+    def test_dataclass_roundtrip(self, tmp_path):
+        """Dataclasses are written directly and read back as plain dicts."""
+        state = WorldState(chapters=[Chapter(number=1, title="Café", filename="c.md")])
+        path = tmp_path / "nested" / "world.json"
+        write_json(path, state)
+
+        data = read_json(path)
+        assert data["chapters"][0]["title"] == "Café"
+        assert data["chapters"][0]["choices"] == []
+        assert "Café" in path.read_text(encoding="utf-8")
+        assert path.read_text(encoding="utf-8").startswith('{\n  "tick": 0,')
@@ -61,6 +61,17 @@ class TestSecurityMiddleware:
 
         assert "X-XSS-Protection" in response.headers
 
+    def test_hsts_only_in_production(self, monkeypatch):
+        """Strict-Transport-Security is only sent when ENVIRONMENT=production."""
+        from living_storyworld.webapp import app
+
+        client = TestClient(app)
+        assert "Strict-Transport-Security" not in client.get("/").headers
+
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        response = client.get("/")
+        assert response.headers["Strict-Transport-Security"].startswith("max-age=")
+
 
 class TestStaticFileServing:
     """Test static file serving."""
@@ -3,13 +3,14 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from living_storyworld.world import (
+    find_chapter,
     init_world,
     load_world,
     save_world,
     tick_world,
     _deserialize_world_state,
 )
-from living_storyworld.models import Choice
+from living_storyworld.models import Chapter, Choice, WorldState
 
 
 class TestDeserializeWorldState:
@@ -216,6 +217,51 @@ class TestInitAndLoadWorld:
             assert cfg.title == "Old"
 
 
+class TestFindChapter:
+    """Test chapter lookup by number."""
+
+    def test_find_chapter(self):
+        """Chapters are found by number, not list position."""
+        state = WorldState(chapters=[
+            Chapter(number=3, title="Three", filename="chapter-0003.md"),
+            Chapter(number=5, title="Five", filename="chapter-0005.md"),
+        ])
+        index, chapter = find_chapter(state, 5)
+        assert index == 1
+        assert chapter.title == "Five"
+        assert find_chapter(state, 4) is None
+
+    def test_find_chapter_after_mutation(self):
+        """The cached index follows pops, appends and replacements."""
+        state = WorldState(chapters=[
+            Chapter(number=1, title="One", filename="chapter-0001.md"),
+            Chapter(number=2, title="Two", filename="chapter-0002.md"),
+        ])
+        assert find_chapter(state, 2)[0] == 1
+
+        state.chapters.pop(0)
+        assert find_chapter(state, 1) is None
+        assert find_chapter(state, 2)[0] == 0
+
+        state.chapters[0] = Chapter(number=7, title="Seven", filename="chapter-0007.md")
+        assert find_chapter(state, 7)[1].title == "Seven"
+        assert find_chapter(state, 2) is None
+
+    def test_index_not_persisted(self, tmp_path):
+        """The cached index never reaches world.json on disk."""
+        from living_storyworld.models import WorldConfig
+
+        state = WorldState(chapters=[Chapter(number=1, title="One", filename="c.md")])
+        find_chapter(state, 1)
+        cfg = WorldConfig(title="Test", slug="test", theme="Theme")
+
+        save_world("test", cfg, state, {"base": tmp_path})
+
+        raw = (tmp_path / "world.json").read_bytes()
+        assert b"_chapter_index" not in raw
+        assert json.loads(raw)["chapters"][0]["number"] == 1
+
+
 class TestSaveAndTickWorld:
     """Test world saving and tick operations."""
 